@@ -1,6 +1,8 @@
 
+from collections.abc import Mapping
 from AbstractBases.Map import Map as abstractMapBase
 from random import randrange
+from time import perf_counter
 
 
 class HashTable(abstractMapBase):
@@ -16,36 +18,418 @@ class HashTable(abstractMapBase):
     [(ai+b) mod p] mod N where Nis the table size and p is a prime number larger than N.
     a is chosen randomly from 1 - N ( a must not be zero as this will make the
     compression function goes into an infinite loop), likewise b is chosen randomly from 0 - N
+    p is moved to a larger prime whenever the table grows past it, otherwise only the
+    first p buckets of the table could ever be addressed.
+
+    Buckets are moved to a new table on resize through _migrateBucket(), which by default
+    re-inserts the items of buckets that are Maps. Subclasses with other buckets override it,
+    or override _resize() altogether.
+    Resizing is done in one go by default. When migration_step is given, the table is
+    resized incrementally instead: the old and the new table coexist and every subsequent
+    write moves the bucket of the key in question plus migration_step other buckets
+    into the new table, spreading the O(n) cost of a rehash over many operations. Reads do
+    not move buckets, so they never reorder the table under an iterator.
+
+    Instrumentation is opt-in through enableStats(): resize events are then recorded with their
+    old and new capacities and duration, and subclasses whose probing code reports how many
+    slots it examined through _recordProbes() count the probes of every get and set. stats()
+    returns a snapshot as a dict, with the load factor and the chain length histogram of
+    subclasses implementing _chainLengths(). While stats are disabled, the only cost left is
+    one `is None` check per get and set.
     """
 
-    def __init__(self, load_factor=0.5, table_size=11, p =137):
+    # True in subclasses that call _recordProbes() on every get and set while stats are enabled
+    _countsProbes = False
+
+    def __init__(self, load_factor=0.5, table_size=11, p =137, migration_step=None):
         if not (isinstance(load_factor, int) or isinstance(load_factor, float)):
             raise TypeError("load factor must be a number.")
         if not isinstance(table_size, int):
             raise TypeError("table_size must be an integer.")
+        if migration_step is not None and not isinstance(migration_step, int):
+            raise TypeError("migration_step must be an integer.")
+        if migration_step is not None and migration_step < 1:
+            raise ValueError("migration_step must be at least 1.")
 
         self._table = [None] * table_size
         self._loadFactor = load_factor
-        self._size = table_size
-        self.__a = randrange(1, p)
-        self.__b = randrange(0, p)
-        self.__p = p
+        self._size = 0
+        self._initialTableSize = table_size
+        self._p = p
+        self._adjustPrime(table_size)
+        self._a = randrange(1, self._p)
+        self._b = randrange(0, self._p)
+        self._migrationStep = migration_step
+        self._oldTable = None
+        self._oldP = None
+        self._migrationCursor = 0
+        self._stats = None
 
     def _hashFunction(self, k):
-        return (hash(k) * self.__a + self.__b) % self.__p % len(self._table)
+        return self._compress(hash(k))
+
+    def _compress(self, h):
+        """
+        Compress an already computed hash value into a bucket index of the current table.
+        :param h: hash value of the key
+        :return: int
+        """
+        return (h * self._a + self._b) % self._p % len(self._table)
+
+    @staticmethod
+    def _validateOpenLoadFactor(load_factor):
+        """
+        Check the load factor of a table whose probe loops only stop at an empty slot: the table
+        must never fill up, so the load factor must be below 1. Subclasses call it before
+        HashTable.__init__ so nothing is allocated for a rejected load factor.
+        :exception raise a TypeError if load_factor is not a number, a ValueError if it is not
+                   between 0 and 1 exclusive
+        """
+        if not (isinstance(load_factor, int) or isinstance(load_factor, float)):
+            raise TypeError("load factor must be a number.")
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1 exclusive.")
+
+    def _adjustPrime(self, capacity):
+        """
+        Keep the MAD prime p larger than the table capacity.
+        :param capacity: capacity of the table about to be used
+        """
+        if self._p <= capacity:
+            self._p = self._nextPrime(2 * capacity + 1)
+
+    def _nextPrime(self, n):
+        """
+        Returns the smallest prime number greater than or equal to n.
+        :param n: int
+        :return: int
+        """
+        if n <= 2:
+            return 2
+        if n % 2 == 0:
+            n += 1
+
+        while True:
+            divisor = 3
+            while divisor * divisor <= n:
+                if n % divisor == 0:
+                    break
+                divisor += 2
+            else:
+                return n
+            n += 2
+
+    def _grownCapacity(self):
+        """
+        Returns the capacity the table should grow to once its load factor is exceeded.
+        Small tables are tripled while large ones are doubled.
+        :return: int
+        """
+        if len(self._table) < 50000:
+            return len(self._table) * 3
+        return len(self._table) * 2
+
+    def capacity(self):
+        """
+        Returns the number of buckets, or slots, of the table.
+        :return: int
+        """
+        return len(self._table)
 
     def _resize(self, newCapacity):
-        print('resizing')
-        oldItems = list(self.items())
+        if self._migrationStep is not None:
+            self.__beginMigration(newCapacity)
+            return
+
+        self.__resizeNow(newCapacity)
+
+    def __resizeNow(self, newCapacity):
+        """
+        Move every bucket to a new table of newCapacity buckets in one go.
+        """
+        oldTable = self._table
+        self._adjustPrime(newCapacity)
         self._table = [None] * newCapacity
-        self._size = 0
 
-        for (k,v) in oldItems:
-            self[k] = v
+        for cursor in range(len(oldTable)):
+            bucket = oldTable[cursor]
+            if bucket is not None:
+                oldTable[cursor] = None
+                self._migrateBucket(bucket)
+
+    def __beginMigration(self, newCapacity):
+        """
+        Swap in an empty table of newCapacity buckets and keep the current one as the old table
+        to be drained by _migrate(). A migration still in progress is completed first.
+        :param newCapacity: capacity of the new table
+        """
+        if self._oldTable is not None:
+            self._migrate(steps=len(self._oldTable))
+
+        self._oldTable = self._table
+        self._oldP = self._p
+        self._migrationCursor = 0
+        self._adjustPrime(newCapacity)
+        self._table = [None] * newCapacity
+
+    def _oldIndex(self, h):
+        """
+        Compress a hash value into a bucket index of the old table being migrated.
+        :param h: hash value of the key
+        :return: int
+        """
+        return (h * self._a + self._b) % self._oldP % len(self._oldTable)
+
+    def _migrate(self, h=None, steps=None):
+        """
+        Move buckets from the old table into the new one while an incremental resize
+        is in progress. Runs in O(steps) bucket moves.
+        :param h: hash value of a key about to be accessed; its old bucket is moved first
+        :param steps: number of buckets to move, defaults to migration_step
+        """
+        oldTable = self._oldTable
+        if oldTable is None:
+            return
+
+        if h is not None:
+            index = self._oldIndex(h)
+            bucket = oldTable[index]
+            if bucket is not None:
+                oldTable[index] = None
+                self._migrateBucket(bucket)
+
+        cursor = self._migrationCursor
+        end = min(cursor + (self._migrationStep if steps is None else steps), len(oldTable))
+
+        while cursor < end:
+            bucket = oldTable[cursor]
+            if bucket is not None:
+                oldTable[cursor] = None
+                self._migrateBucket(bucket)
+            cursor += 1
+
+        self._migrationCursor = cursor
+        if cursor == len(oldTable):
+            self._oldTable = None
+            self._oldP = None
+
+    def _migrateBucket(self, bucket):
+        """
+        Re-insert every item of a bucket taken from the old table into the new table.
+        Only called by the _resize() of this class. The default works for tables whose buckets
+        are Maps, creating buckets of the same type in the new table, and rehashes every key.
+        ChainedHashTable overrides it to move its items along with their cached hash values.
+        The open addressing tables override _resize() itself and never get here.
+        :param bucket: bucket removed from the old table, a Map
+        """
+        table = self._table
+        for k in bucket:
+            bucketIndex = self._compress(hash(k))
+            if table[bucketIndex] is None:
+                table[bucketIndex] = type(bucket)()
+            table[bucketIndex][k] = bucket[k]
+
+    def isMigrating(self):
+        """
+        Checks if an incremental resize is in progress.
+        :return: boolean
+        """
+        return self._oldTable is not None
+
+    def migrationProgress(self):
+        """
+        Returns the fraction of the old table already moved to the new one,
+        1.0 when no incremental resize is in progress.
+        :return: float
+        """
+        if self._oldTable is None:
+            return 1.0
+        return self._migrationCursor / len(self._oldTable)
+
+    def _capacityFor(self, n):
+        """
+        Returns the capacity to pass to _resize() for n items to fit under the load factor,
+        or None if the table is already large enough.
+        :param n: number of items
+        :return: int or None
+        """
+        needed = int(n / self._loadFactor) + 1
+        if needed > len(self._table):
+            return needed
+        return None
+
+    def _reserve(self, n):
+        """
+        Grow the table in one go, blocking even in incremental mode, so that n items fit
+        without any further resize.
+        :param n: number of items
+        """
+        if self._oldTable is not None:
+            self._migrate(steps=len(self._oldTable))
+
+        capacity = self._capacityFor(n)
+        if capacity is None:
+            return
+
+        if self._migrationStep is None:
+            self._resize(capacity)
+        elif self._stats is None:
+            self.__resizeNow(capacity)
+        else:
+            oldCapacity = self.capacity()
+            start = perf_counter()
+            self.__resizeNow(capacity)
+            self._recordResize(oldCapacity, perf_counter() - start, False)
+
+    def _bulkSet(self, pairs):
+        """
+        Insert (key, value) pairs into a table already sized for them by _reserve().
+        Subclasses may override it with a tight loop skipping the load factor checks.
+        :param pairs: list of (key, value) pairs
+        """
+        for k, value in pairs:
+            self[k] = value
+
+    def updateMany(self, pairs):
+        """
+        Insert many items at once. The table is pre-sized once from the number of items
+        instead of going through every intermediate resize.
+        :param pairs: a Mapping or an iterable of (key, value) pairs
+        """
+        if isinstance(pairs, Mapping):
+            pairs = list(pairs.items())
+        elif not isinstance(pairs, list):
+            pairs = list(pairs)
+
+        self._reserve(self._size + len(pairs))
+        self._bulkSet(pairs)
+
+    def getMany(self, keys, default=None):
+        """
+        Look many keys up at once.
+        :param keys: iterable of keys
+        :param default: value returned for a missing key
+        :return: list of values in the order of keys
+        """
+        values = []
+        for k in keys:
+            try:
+                values.append(self[k])
+            except KeyError:
+                values.append(default)
+        return values
+
+    @classmethod
+    def fromPairs(cls, pairs, **kwargs):
+        """
+        Build a table pre-sized for the given items.
+        :param pairs: a Mapping or an iterable of (key, value) pairs
+        :param kwargs: arguments of the table constructor
+        :return: HashTable
+        """
+        table = cls(**kwargs)
+        table.updateMany(pairs)
+        return table
+
+    def enableStats(self):
+        """
+        Start collecting stats, from zero. _resize() is shadowed by a timing wrapper on this
+        instance only, so tables without stats do not pay for it.
+        """
+        self._stats = {'resizes': [], 'get': 0, 'getProbes': 0, 'set': 0, 'setProbes': 0}
+        resize = type(self)._resize
+
+        def timedResize(newCapacity):
+            oldCapacity = self.capacity()
+            start = perf_counter()
+            resize(self, newCapacity)
+            self._recordResize(oldCapacity, perf_counter() - start,
+                               self._oldTable is not None)
+
+        self._resize = timedResize
+
+    def disableStats(self):
+        """
+        Stop collecting stats and drop the ones collected so far.
+        """
+        self._stats = None
+        self.__dict__.pop('_resize', None)
+
+    def _recordResize(self, oldCapacity, seconds, incremental):
+        """
+        Record a resize event.
+        :param incremental: True if only an incremental migration was started, seconds then
+                            covers the swap of tables but not the migration itself
+        """
+        self._stats['resizes'].append({'oldCapacity': oldCapacity, 'newCapacity': self.capacity(),
+                                       'seconds': seconds, 'incremental': incremental})
+
+    def _recordProbes(self, operation, probes):
+        """
+        Count one get or set and the number of slots, or bucket items, its lookup examined, as
+        counted by the probing code itself. A set counts the lookup of its key made before the
+        item is stored, so gets and sets are measured alike.
+        Called by subclasses only while stats are enabled.
+        :param operation: 'get' or 'set'
+        """
+        stats = self._stats
+        stats[operation] += 1
+        stats[operation + 'Probes'] += probes
+
+    def _chainLengths(self):
+        """
+        Returns the length of every chain of the table: items per bucket for separate chaining,
+        probes needed to reach the item of every slot for open addressing, 0 for an empty
+        bucket or slot. Subclasses able to tell override it, None means no histogram is reported.
+        :return: iterable of int or None
+        """
+        return None
+
+    def stats(self):
+        """
+        Returns a snapshot of the stats collected since enableStats():
+            size, capacity and loadFactor: current state of the table
+            resizes: list of resize events, dicts of oldCapacity, newCapacity, seconds and
+                     incremental
+            gets, sets: number of gets and sets counted, meanGetProbes and meanSetProbes the
+                        mean number of probes they took. All four are None for tables that do
+                        not count probes, see _countsProbes
+            chainLengths: histogram of the chain lengths as a dict {length: count},
+                          occupancy: ratio of non empty buckets
+        :return: dict, or None if stats are disabled
+        """
+        stats = self._stats
+        if stats is None:
+            return None
+
+        snapshot = {'size': len(self), 'capacity': self.capacity(),
+                    'loadFactor': len(self) / self.capacity(),
+                    'resizes': [dict(event) for event in stats['resizes']],
+                    'gets': None, 'sets': None, 'meanGetProbes': None, 'meanSetProbes': None}
+
+        if self._countsProbes:
+            snapshot['gets'], snapshot['sets'] = stats['get'], stats['set']
+            snapshot['meanGetProbes'] = stats['getProbes'] / stats['get'] if stats['get'] else 0.0
+            snapshot['meanSetProbes'] = stats['setProbes'] / stats['set'] if stats['set'] else 0.0
+
+        chainLengths = self._chainLengths()
+        if chainLengths is not None:
+            histogram = {}
+            chains = 0
+            for length in chainLengths:
+                histogram[length] = histogram.get(length, 0) + 1
+                chains += 1
+            snapshot['chainLengths'] = dict(sorted(histogram.items()))
+            snapshot['occupancy'] = (chains - histogram.get(0, 0)) / chains if chains else 0.0
+
+        return snapshot
 
     def __len__(self):
         return self._size
 
     def clear(self):
-        self._table = []
-        self._size = 0
\ No newline at end of file
+        self._table = [None] * self._initialTableSize
+        self._size = 0
+        self._oldTable = None
+        self._oldP = None
+        self._migrationCursor = 0
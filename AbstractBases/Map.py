@@ -1,15 +1,22 @@
 
 from abc import ABCMeta, abstractmethod
-from collections import MutableMapping
+from collections.abc import MutableMapping
 
 
 class Map (MutableMapping, metaclass=ABCMeta):
 
     class _Item():
+        """
+        Class represent a key/value pair along with the hash value of its key, so maps
+        can skip the equality check on hash mismatch and never re-hash a key on resize.
+        The hash value is None for a key that is not hashable.
+        """
+        __slots__ = '_key', '_value', '_hash'
 
-        def __init__(self, k, value):
+        def __init__(self, k, value, h=None):
             self._key = k
             self._value = value
+            self._hash = h
 
     @abstractmethod
     def clear(self):
@@ -0,0 +1,64 @@
+
+from abc import abstractmethod
+from AbstractBases.Map import Map as abstractMapBase
+
+
+class SortedMap(abstractMapBase):
+    """
+    Abstract class for a map whose keys are kept in ascending order, so ordered queries
+    need neither a full scan nor a sort. Keys must be comparable with one another.
+    Iteration yields the keys in ascending order.
+
+    Ordered queries return a (key, value) tuple, or None if no such item exists.
+    """
+
+    @abstractmethod
+    def first(self):
+        """
+        Returns the item with the smallest key.
+        :return: tuple (key, value) or None if the map is empty
+        """
+
+    @abstractmethod
+    def last(self):
+        """
+        Returns the item with the largest key.
+        :return: tuple (key, value) or None if the map is empty
+        """
+
+    @abstractmethod
+    def floor(self, k):
+        """
+        Returns the item with the largest key less than or equal to k.
+        :return: tuple (key, value) or None
+        """
+
+    @abstractmethod
+    def ceiling(self, k):
+        """
+        Returns the item with the smallest key greater than or equal to k.
+        :return: tuple (key, value) or None
+        """
+
+    @abstractmethod
+    def predecessor(self, k):
+        """
+        Returns the item with the largest key strictly less than k.
+        :return: tuple (key, value) or None
+        """
+
+    @abstractmethod
+    def successor(self, k):
+        """
+        Returns the item with the smallest key strictly greater than k.
+        :return: tuple (key, value) or None
+        """
+
+    @abstractmethod
+    def findRange(self, start=None, stop=None):
+        """
+        Lazily yield the items whose key k satisfies start <= k < stop, in ascending order.
+        :param start: lower bound, None to start from the smallest key
+        :param stop: upper bound (excluded), None to go up to the largest key
+        :return: Generator of tuple (key, value)
+        """
@@ -0,0 +1,126 @@
+
+import datetime as DT
+import gc
+import tracemalloc
+from random import shuffle
+
+
+class HashTableBenchmark():
+    """Programs time the basic operations of HashTable implementations against
+       the same workload so their running time and memory footprint can be compared.
+    """
+    def __init__(self, n=100000):
+        if n < 1:
+            raise ValueError("n must be at least one")
+        self.n = n
+        self.keys = ['key-%s' % index for index in range(n)]
+        self.missingKeys = ['missing-%s' % index for index in range(n)]
+        shuffle(self.keys)
+
+    def __timeIt(self, action):
+        startTime = DT.datetime.now()
+        action()
+        return (DT.datetime.now() - startTime).total_seconds()
+
+    def run(self, tableFactory, name=None):
+        """Runs insert, hit lookup, miss lookup and delete passes of n keys each on a new
+           table created by tableFactory() and prints the time taken by every pass.
+           :return: dict of pass name to seconds, plus the peak memory of the insert pass in bytes
+        """
+        table = tableFactory()
+        keys = self.keys
+        results = {}
+
+        def insert():
+            for key in keys:
+                table[key] = key
+
+        def hits():
+            for key in keys:
+                table[key]
+
+        def misses():
+            for key in self.missingKeys:
+                key in table
+
+        def delete():
+            for key in keys:
+                del table[key]
+
+        tracemalloc.start()
+        results['insert'] = self.__timeIt(insert)
+        results['peakMemory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results['hit'] = self.__timeIt(hits)
+        results['miss'] = self.__timeIt(misses)
+        results['delete'] = self.__timeIt(delete)
+
+        print("%s with n = %s" % (name or type(table).__name__, self.n))
+        for passName in ('insert', 'hit', 'miss', 'delete'):
+            print("\t%s in seconds: %s" % (passName, results[passName]))
+        print("\tpeak memory while inserting in bytes: %s" % results['peakMemory'])
+
+        return results
+
+    def worstInsertLatency(self, tableFactory, name=None):
+        """Inserts the n keys one at a time on a new table created by tableFactory() and
+           prints the slowest single insertion, which is where a blocking resize shows up.
+           The cyclic garbage collector is paused meanwhile so its pauses are not mistaken for resizes.
+           :return: seconds taken by the slowest insertion
+        """
+        table = tableFactory()
+        worst = 0
+
+        gc.disable()
+        try:
+            for key in self.keys:
+                startTime = DT.datetime.now()
+                table[key] = key
+                worst = max(worst, (DT.datetime.now() - startTime).total_seconds())
+        finally:
+            gc.enable()
+
+        print("%s slowest single insert in seconds: %s" % (name or type(table).__name__, worst))
+        return worst
+
+    def bulkLoad(self, tableClass):
+        """Loads the n keys in a new table of tableClass one __setitem__ at a time, then
+           through fromPairs(), and prints the time taken by both.
+           :return: tuple of seconds (one at a time, bulk)
+        """
+        pairs = [(key, key) for key in self.keys]
+
+        def oneAtATime():
+            table = tableClass()
+            for key, value in pairs:
+                table[key] = value
+
+        single = self.__timeIt(oneAtATime)
+        bulk = self.__timeIt(lambda: tableClass.fromPairs(pairs))
+
+        print("%s load of %s keys, one at a time in seconds: %s, fromPairs in seconds: %s"
+              % (tableClass.__name__, self.n, single, bulk))
+        return single, bulk
+
+
+if __name__ == "__main__":
+    from MapADT.ChainedHashTable import ChainedHashTable
+    from MapADT.CompactHashTable import CompactHashTable
+    from MapADT.CuckooHashTable import CuckooHashTable
+    from MapADT.OpenAddressHashTable import OpenAddressHashTable
+    from MapADT.RobinHoodHashTable import RobinHoodHashTable
+
+    benchmark = HashTableBenchmark(100000)
+    benchmark.run(ChainedHashTable)
+    benchmark.run(lambda: OpenAddressHashTable(probing=0), "OpenAddressHashTable (linear probing)")
+    benchmark.run(lambda: OpenAddressHashTable(probing=1), "OpenAddressHashTable (quadratic probing)")
+    benchmark.run(CompactHashTable)
+    benchmark.run(RobinHoodHashTable)
+    benchmark.run(CuckooHashTable)
+
+    benchmark.bulkLoad(ChainedHashTable)
+    benchmark.bulkLoad(OpenAddressHashTable)
+
+    benchmark.worstInsertLatency(ChainedHashTable)
+    benchmark.worstInsertLatency(lambda: ChainedHashTable(migration_step=8), "ChainedHashTable (incremental resize)")
@@ -0,0 +1,151 @@
+
+import datetime as DT
+import heapq
+from random import random
+
+
+class HeapBenchmark():
+    """Programs time priority queue implementations against the same workload of n operations:
+       n / 2 inserts of random priorities followed by n / 2 removeTop, so their throughput can be
+       compared with each other and with the standard library heapq.
+    """
+    def __init__(self, n=1000000):
+        if n < 2:
+            raise ValueError("n must be at least two")
+        self.n = n
+        self.priorities = [random() for index in range(n // 2)]
+
+    def __timeIt(self, action):
+        startTime = DT.datetime.now()
+        action()
+        return (DT.datetime.now() - startTime).total_seconds()
+
+    def __report(self, name, results):
+        print("%s with n = %s" % (name, self.n))
+        for passName in ('insert', 'removeTop'):
+            print("\t%s in seconds: %s" % (passName, results[passName]))
+        print("\toperations per second: %.0f" % (self.n / (results['insert'] + results['removeTop'])))
+
+    def run(self, heapFactory, name=None):
+        """Runs the insert pass then the removeTop pass on a new heap created by heapFactory()
+           and prints the time taken by both.
+           :return: dict of pass name to seconds
+        """
+        heap = heapFactory()
+        priorities = self.priorities
+        results = {}
+
+        def insert():
+            for priority in priorities:
+                heap.insert(priority)
+
+        def removeTop():
+            for index in range(len(priorities)):
+                heap.removeTop()
+
+        results['insert'] = self.__timeIt(insert)
+        results['removeTop'] = self.__timeIt(removeTop)
+
+        self.__report(name or type(heap).__name__, results)
+        return results
+
+    def mixed(self, heapFactory, ratio):
+        """Runs n operations on a new heap created by heapFactory() and heapified with n / 2
+           priorities, repeating ratio inserts followed by one removeTop, so the heap grows as it
+           would under that insert/remove ratio.
+           :return: seconds
+        """
+        heap = heapFactory()
+        heap.heapify(list(self.priorities))
+        priorities = self.priorities * 2
+        cycle = ratio + 1
+
+        def operations():
+            inserted = 0
+            for step in range(self.n):
+                if step % cycle == ratio:
+                    heap.removeTop()
+                else:
+                    heap.insert(priorities[inserted])
+                    inserted += 1
+
+        return self.__timeIt(operations)
+
+    def matrix(self, arities=(2, 3, 4, 5, 6, 8, 16), ratios=(1, 4, 16, 64)):
+        """Runs the mixed workload on a min Heap of every arity for every insert/remove ratio and
+           prints a table of operations per second, one row per arity.
+           :return: dict of (arity, ratio) to seconds
+        """
+        from PriorityQueueADT.Heap import Heap
+
+        results = {}
+        print("Heap operations per second with n = %s, by arity and insert/remove ratio" % self.n)
+        print("\tarity" + "".join("\t%s:1" % ratio for ratio in ratios))
+        for arity in arities:
+            row = "\t%s" % arity
+            for ratio in ratios:
+                seconds = self.mixed(lambda: Heap(order=0, dType=float, arity=arity), ratio)
+                results[(arity, ratio)] = seconds
+                row += "\t%.0f" % (self.n / seconds)
+            print(row)
+
+        return results
+
+    def monotone(self, heapFactory, name=None, span=1000):
+        """Runs n operations on a new heap created by heapFactory(), alternating an insert of
+           the last priority removed plus a random integer below span with a removeTop, like
+           Dijkstra's algorithm does, so monotone queues such as RadixHeap can be compared with
+           the others. The heap is first filled with n / 2 such priorities.
+           :return: seconds
+        """
+        heap = heapFactory()
+        offsets = [int(priority * span) for priority in self.priorities]
+        for offset in offsets:
+            heap.insert(offset)
+
+        def operations():
+            last = 0
+            for offset in offsets:
+                heap.insert(last + offset)
+                last = heap.removeTop()
+
+        seconds = self.__timeIt(operations)
+        print("%s monotone with n = %s: %.0f operations per second"
+              % (name or type(heap).__name__, self.n, self.n / seconds))
+        return seconds
+
+    def runHeapq(self):
+        """Runs the same passes with heapq.heappush and heapq.heappop on a plain list.
+           :return: dict of pass name to seconds
+        """
+        heap = []
+        priorities = self.priorities
+        results = {}
+
+        def insert():
+            for priority in priorities:
+                heapq.heappush(heap, priority)
+
+        def removeTop():
+            for index in range(len(priorities)):
+                heapq.heappop(heap)
+
+        results['insert'] = self.__timeIt(insert)
+        results['removeTop'] = self.__timeIt(removeTop)
+
+        self.__report("heapq", results)
+        return results
+
+
+if __name__ == "__main__":
+    from PriorityQueueADT.Heap import Heap
+
+    benchmark = HeapBenchmark(1000000)
+    benchmark.run(lambda: Heap(order=0, dType=float), "Heap (min)")
+    benchmark.run(lambda: Heap(order=1, dType=float), "Heap (max)")
+    benchmark.runHeapq()
+    benchmark.matrix()
+
+    from PriorityQueueADT.RadixHeap import RadixHeap
+    benchmark.monotone(lambda: Heap(order=0, dType=int), "Heap (min)")
+    benchmark.monotone(RadixHeap)
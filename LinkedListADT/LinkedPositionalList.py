@@ -17,17 +17,17 @@ class LinkedPositionalList(AbstractBaseList):
             self.__nextNode = nextNode
             self.__prevNode = prevNode
 
-        def nextNode(self, node):
+        def nextNode(self, node=None):
             if node is None:
                 return self.__nextNode
             self.__nextNode = node
 
-        def prevNode(self, node):
+        def prevNode(self, node=None):
             if node is None:
                 return self.__prevNode
             self.__prevNode = node
 
-        def element(self, e):
+        def element(self, e=None):
             if e is None:
                 return self.__element
             self.__element = e
@@ -121,11 +121,13 @@ class LinkedPositionalList(AbstractBaseList):
 
     def remove(self, p):
         node = self.__validatePosition(p)
+        e = node.element()
         self.__removeNode(node)
         self.__size -= 1
+        return e
 
     def addLast(self, e):
-        position = self.__insertBetween(e, self.__trailer.prevNode(), self.__header)
+        position = self.__insertBetween(e, self.__trailer.prevNode(), self.__trailer)
         self.__size += 1
         return position
 
@@ -153,6 +155,9 @@ class LinkedPositionalList(AbstractBaseList):
     def isEmpty(self):
         return self.__size == 0
 
+    def __len__(self):
+        return self.__size
+
     def __iter__(self):
         cursor = self.first()
 
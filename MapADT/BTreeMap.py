@@ -0,0 +1,388 @@
+
+from bisect import bisect_left, bisect_right
+from AbstractBases.SortedMap import SortedMap as abstractSortedMap
+
+
+class BTreeMap(abstractSortedMap):
+    """
+    Class implements a SortedMap with a B+ tree. Every node holds up to fanout sorted keys in a
+    plain list searched with bisect, so a lookup visits log_fanout(n) nodes instead of one node
+    per key, and the structure costs a few lists per fanout keys rather than one object per key.
+
+    Items live in the leaves only, which are doubly linked in key order: ordered iteration and
+    range queries walk the leaf lists without touching the internal nodes.
+    Internal nodes hold the child pointers and separator keys, _keys[i] being a lower bound of
+    the keys in _children[i + 1] and an upper bound (excluded) of the keys in _children[i].
+
+    Every node but the root is kept at least half full: inserting splits a full node in two,
+    deleting borrows from a sibling or merges with it.
+    """
+
+    class _Leaf:
+        __slots__ = '_keys', '_values', '_prev', '_next'
+
+        def __init__(self, keys, values):
+            self._keys = keys
+            self._values = values
+            self._prev = None
+            self._next = None
+
+    class _Internal:
+        __slots__ = '_keys', '_children'
+
+        def __init__(self, keys, children):
+            self._keys = keys
+            self._children = children
+
+    def __init__(self, fanout=64):
+        """
+        Init the map
+        :param fanout: maximum number of items of a leaf and of children of an internal node
+        """
+        if not isinstance(fanout, int):
+            raise TypeError("fanout must be an integer.")
+        if fanout < 3:
+            raise ValueError("fanout must be at least 3.")
+
+        self.__fanout = fanout
+        self.__minLeaf = fanout // 2
+        self.__minChildren = (fanout + 1) // 2
+        self.__root = self._Leaf([], [])
+        self.__size = 0
+
+    def __findLeaf(self, k):
+        node = self.__root
+        while type(node) is self._Internal:
+            node = node._children[bisect_right(node._keys, k)]
+        return node
+
+    def __findPath(self, k):
+        """
+        Returns the leaf where k belongs and the path leading to it.
+        :return: tuple (leaf, list of (internal node, child index))
+        """
+        path = []
+        node = self.__root
+        while type(node) is self._Internal:
+            i = bisect_right(node._keys, k)
+            path.append((node, i))
+            node = node._children[i]
+        return node, path
+
+    def __getitem__(self, k):
+        leaf = self.__findLeaf(k)
+        i = bisect_left(leaf._keys, k)
+        if i == len(leaf._keys) or leaf._keys[i] != k:
+            raise KeyError("KeyError: " + repr(k))
+        return leaf._values[i]
+
+    def __contains__(self, k):
+        leaf = self.__findLeaf(k)
+        i = bisect_left(leaf._keys, k)
+        return i < len(leaf._keys) and leaf._keys[i] == k
+
+    def __setitem__(self, k, value):
+        leaf, path = self.__findPath(k)
+        keys = leaf._keys
+        i = bisect_left(keys, k)
+
+        if i < len(keys) and keys[i] == k:
+            leaf._values[i] = value
+            return
+
+        keys.insert(i, k)
+        leaf._values.insert(i, value)
+        self.__size += 1
+
+        if len(keys) > self.__fanout:
+            self.__split(leaf, path)
+
+    def __split(self, node, path):
+        """
+        Split an overflowing node in two, adding the right half to its parent, and carry on up
+        the path while the parent overflows in turn.
+        """
+        while True:
+            mid = len(node._keys) // 2
+
+            if type(node) is self._Leaf:
+                right = self._Leaf(node._keys[mid:], node._values[mid:])
+                del node._keys[mid:], node._values[mid:]
+                right._prev, right._next = node, node._next
+                if node._next is not None:
+                    node._next._prev = right
+                node._next = right
+                separator = right._keys[0]
+            else:
+                right = self._Internal(node._keys[mid + 1:], node._children[mid + 1:])
+                separator = node._keys[mid]
+                del node._keys[mid:], node._children[mid + 1:]
+
+            if not path:
+                self.__root = self._Internal([separator], [node, right])
+                return
+
+            parent, i = path.pop()
+            parent._keys.insert(i, separator)
+            parent._children.insert(i + 1, right)
+
+            if len(parent._children) <= self.__fanout:
+                return
+            node = parent
+
+    def __delitem__(self, k):
+        leaf, path = self.__findPath(k)
+        i = bisect_left(leaf._keys, k)
+
+        if i == len(leaf._keys) or leaf._keys[i] != k:
+            raise KeyError("KeyError: " + repr(k))
+
+        del leaf._keys[i], leaf._values[i]
+        self.__size -= 1
+
+        if len(leaf._keys) < self.__minLeaf and path:
+            self.__rebalance(leaf, path)
+
+    def __rebalance(self, node, path):
+        """
+        Refill an underflowing node from a sibling, borrowing one entry if the sibling can spare
+        it or merging the two nodes otherwise, and carry on up the path while merges make the
+        parent underflow in turn. The root collapses when left with a single child.
+        """
+        while path:
+            parent, i = path.pop()
+            children = parent._children
+            isLeaf = type(node) is self._Leaf
+            minimum = self.__minLeaf if isLeaf else self.__minChildren
+
+            left = children[i - 1] if i > 0 else None
+            right = children[i + 1] if i + 1 < len(children) else None
+
+            if left is not None and self.__entries(left) > minimum:
+                if isLeaf:
+                    node._keys.insert(0, left._keys.pop())
+                    node._values.insert(0, left._values.pop())
+                    parent._keys[i - 1] = node._keys[0]
+                else:
+                    node._keys.insert(0, parent._keys[i - 1])
+                    node._children.insert(0, left._children.pop())
+                    parent._keys[i - 1] = left._keys.pop()
+                return
+
+            if right is not None and self.__entries(right) > minimum:
+                if isLeaf:
+                    node._keys.append(right._keys.pop(0))
+                    node._values.append(right._values.pop(0))
+                    parent._keys[i] = right._keys[0]
+                else:
+                    node._keys.append(parent._keys[i])
+                    node._children.append(right._children.pop(0))
+                    parent._keys[i] = right._keys.pop(0)
+                return
+
+            if left is not None:
+                self.__merge(parent, i - 1)
+            else:
+                self.__merge(parent, i)
+
+            if parent is self.__root:
+                if len(children) == 1:
+                    self.__root = children[0]
+                return
+            if len(children) >= self.__minChildren:
+                return
+            node = parent
+
+    def __entries(self, node):
+        if type(node) is self._Leaf:
+            return len(node._keys)
+        return len(node._children)
+
+    def __merge(self, parent, i):
+        """
+        Merge child i + 1 of parent into child i.
+        """
+        node = parent._children[i]
+        right = parent._children[i + 1]
+
+        if type(node) is self._Leaf:
+            node._keys.extend(right._keys)
+            node._values.extend(right._values)
+            node._next = right._next
+            if right._next is not None:
+                right._next._prev = node
+        else:
+            node._keys.append(parent._keys[i])
+            node._keys.extend(right._keys)
+            node._children.extend(right._children)
+
+        del parent._keys[i], parent._children[i + 1]
+
+    def __len__(self):
+        return self.__size
+
+    def __firstLeaf(self):
+        node = self.__root
+        while type(node) is self._Internal:
+            node = node._children[0]
+        return node
+
+    def __lastLeaf(self):
+        node = self.__root
+        while type(node) is self._Internal:
+            node = node._children[-1]
+        return node
+
+    def __iter__(self):
+        leaf = self.__firstLeaf()
+        while leaf is not None:
+            yield from leaf._keys
+            leaf = leaf._next
+
+    def __reversed__(self):
+        leaf = self.__lastLeaf()
+        while leaf is not None:
+            yield from reversed(leaf._keys)
+            leaf = leaf._prev
+
+    def __item(self, leaf, i):
+        """
+        Returns the item at index i of a leaf, moving on to the next or previous leaf when i is
+        past either end of it.
+        """
+        if i < 0:
+            leaf = leaf._prev
+            if leaf is None:
+                return None
+            i = len(leaf._keys) - 1
+        elif i == len(leaf._keys):
+            leaf = leaf._next
+            if leaf is None:
+                return None
+            i = 0
+
+        if i >= len(leaf._keys):
+            return None
+        return leaf._keys[i], leaf._values[i]
+
+    def first(self):
+        return self.__item(self.__firstLeaf(), 0)
+
+    def last(self):
+        leaf = self.__lastLeaf()
+        return self.__item(leaf, len(leaf._keys) - 1)
+
+    def floor(self, k):
+        leaf = self.__findLeaf(k)
+        return self.__item(leaf, bisect_right(leaf._keys, k) - 1)
+
+    def ceiling(self, k):
+        leaf = self.__findLeaf(k)
+        return self.__item(leaf, bisect_left(leaf._keys, k))
+
+    def predecessor(self, k):
+        leaf = self.__findLeaf(k)
+        return self.__item(leaf, bisect_left(leaf._keys, k) - 1)
+
+    def successor(self, k):
+        leaf = self.__findLeaf(k)
+        return self.__item(leaf, bisect_right(leaf._keys, k))
+
+    def findRange(self, start=None, stop=None):
+        if start is None:
+            leaf = self.__firstLeaf()
+            i = 0
+        else:
+            leaf = self.__findLeaf(start)
+            i = bisect_left(leaf._keys, start)
+
+        while leaf is not None:
+            keys = leaf._keys
+            end = len(keys) if stop is None else bisect_left(keys, stop)
+            for j in range(i, end):
+                yield keys[j], leaf._values[j]
+            if end < len(keys):
+                return
+            leaf = leaf._next
+            i = 0
+
+    def clear(self):
+        self.__root = self._Leaf([], [])
+        self.__size = 0
+
+    def fanout(self):
+        return self.__fanout
+
+    @staticmethod
+    def __groupSizes(count, capacity):
+        """
+        Split count entries into as few groups of at most capacity entries as possible,
+        sized evenly so that every group is at least half full.
+        :return: list of int
+        """
+        groups = -(-count // capacity)
+        size, extra = divmod(count, groups)
+        return [size + 1] * extra + [size] * (groups - extra)
+
+    @classmethod
+    def fromSorted(cls, pairs, fanout=64):
+        """
+        Build a map from (key, value) pairs sorted by strictly ascending keys, in O(n) time:
+        the leaves are filled in order, then every level of internal nodes is built over the
+        one below it, with no search nor split.
+        :param pairs: iterable of (key, value) pairs
+        :param fanout: see __init__
+        :return: BTreeMap
+        :exception raise a ValueError if the keys are not strictly ascending
+        """
+        tree = cls(fanout)
+        keys = []
+        values = []
+
+        for k, value in pairs:
+            if keys and not keys[-1] < k:
+                raise ValueError("keys must be sorted in strictly ascending order.")
+            keys.append(k)
+            values.append(value)
+
+        if not keys:
+            return tree
+
+        nodes = []
+        lowest = []  # smallest key of the subtree of each node of the current level
+        cursor = 0
+        previous = None
+        for size in cls.__groupSizes(len(keys), fanout):
+            leaf = cls._Leaf(keys[cursor:cursor + size], values[cursor:cursor + size])
+            leaf._prev = previous
+            if previous is not None:
+                previous._next = leaf
+            nodes.append(leaf)
+            lowest.append(keys[cursor])
+            previous = leaf
+            cursor += size
+
+        while len(nodes) > 1:
+            parents = []
+            parentsLowest = []
+            cursor = 0
+            for size in cls.__groupSizes(len(nodes), fanout):
+                parents.append(cls._Internal(lowest[cursor + 1:cursor + size], nodes[cursor:cursor + size]))
+                parentsLowest.append(lowest[cursor])
+                cursor += size
+            nodes, lowest = parents, parentsLowest
+
+        tree.__root = nodes[0]
+        tree.__size = len(keys)
+        return tree
+
+
+if __name__ == '__main__':
+    m = BTreeMap.fromSorted(((year, 'release %d' % year) for year in range(2010, 2020)), fanout=4)
+    m[2021] = 'release 2021'
+    del m[2013]
+
+    print(len(m), m.first(), m.last())
+    print(m.floor(2013), m.ceiling(2013), m.predecessor(2010), m.successor(2019))
+    print(list(m.findRange(2012, 2016)))
+    print(list(reversed(m)))
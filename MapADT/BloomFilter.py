@@ -0,0 +1,222 @@
+
+from math import ceil, log
+from random import randrange
+
+
+class BloomFilter():
+    """
+    Class implements a Bloom filter: a set that answers membership queries in fixed memory with
+    no false negatives and a configurable rate of false positives. It stores a bit array of m bits
+    in a bytearray and sets k bits per key added; a key is reported present if all its k bits are
+    set. Keys cannot be removed.
+
+    The k bit positions are derived from hash(k) by double hashing:
+        h1 = mix(hash(k) xor s1) mod m,  h2 = 1 + mix(hash(k) xor s2) mod (m - 1)
+        position i = (h1 + i * h2) mod m  for i in 0 .. k - 1
+    so a key is hashed once whatever k. A miss usually stops at the first clear bit.
+    mix is the splitmix64 finalizer (multiply-xorshift rounds) and s1, s2 are random seeds:
+    hash() of an int is the int itself, and without mixing consecutive keys would get
+    correlated positions. m is rounded up to a prime so that every step h2 is coprime with m
+    and the k positions of a key are always distinct.
+
+    For n keys and a false positive rate e, m = -n ln(e) / ln(2)^2 and k = (m / n) ln(2).
+    """
+
+    __MASK64 = 2 ** 64 - 1
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Init the filter
+        :param capacity: number of keys the filter is sized for
+        :param error_rate: false positive rate once capacity keys have been added
+        """
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an integer.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if not isinstance(error_rate, float) or not 0 < error_rate < 1:
+            raise ValueError("error_rate must be a float between 0 and 1.")
+
+        self._capacity = capacity
+        self._errorRate = error_rate
+        self._m = self.__nextPrime(max(11, ceil(-capacity * log(error_rate) / log(2) ** 2)))
+        self._k = max(1, round(self._m / capacity * log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        self._seed1 = randrange(0, 2 ** 64)
+        self._seed2 = randrange(0, 2 ** 64)
+        self._count = 0
+
+    @staticmethod
+    def __nextPrime(n):
+        """
+        Returns the smallest prime number greater than or equal to n, n being at least 3.
+        """
+        n |= 1
+        while True:
+            divisor = 3
+            while divisor * divisor <= n:
+                if n % divisor == 0:
+                    break
+                divisor += 2
+            else:
+                return n
+            n += 2
+
+    @staticmethod
+    def __mix(x):
+        """
+        splitmix64 finalizer: scramble the bits of a 64 bits integer so that every input bit
+        affects every output bit.
+        :return: int
+        """
+        mask = BloomFilter.__MASK64
+        x = ((x ^ (x >> 30)) * 0xbf58476d1ce4e5b9) & mask
+        x = ((x ^ (x >> 27)) * 0x94d049bb133111eb) & mask
+        return x ^ (x >> 31)
+
+    def __probe(self, k):
+        """
+        Returns the first bit position of key k and the step between its positions.
+        """
+        h = hash(k) & self.__MASK64
+        m = self._m
+        return self.__mix(h ^ self._seed1) % m, 1 + self.__mix(h ^ self._seed2) % (m - 1)
+
+    def add(self, k):
+        """
+        Add key k to the filter.
+        """
+        position, step = self.__probe(k)
+        m = self._m
+        bits = self._bits
+
+        for i in range(self._k):
+            bits[position >> 3] |= 1 << (position & 7)
+            position = (position + step) % m
+        self._count += 1
+
+    def __contains__(self, k):
+        position, step = self.__probe(k)
+        m = self._m
+        bits = self._bits
+
+        for i in range(self._k):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + step) % m
+        return True
+
+    def __len__(self):
+        """
+        Returns the number of keys added, counting a key added several times as many times.
+        """
+        return self._count
+
+    def isFull(self):
+        """
+        Checks if capacity keys have been added, beyond which the false positive rate exceeds
+        error_rate.
+        :return: boolean
+        """
+        return self._count >= self._capacity
+
+    def capacity(self):
+        return self._capacity
+
+    def hashCount(self):
+        """
+        Returns k, the number of bits set per key.
+        """
+        return self._k
+
+    def bitCount(self):
+        """
+        Returns m, the size of the bit array.
+        """
+        return self._m
+
+    def currentErrorRate(self):
+        """
+        Returns the expected false positive rate given the number of keys added so far.
+        :return: float
+        """
+        return (1 - (1 - 1 / self._m) ** (self._k * self._count)) ** self._k
+
+    def clear(self):
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+
+class ScalableBloomFilter():
+    """
+    Class implements a Bloom filter that keeps its false positive rate bounded however many keys
+    are added, for when the number of keys is not known in advance. It holds a list of BloomFilter
+    stages: keys go to the last stage and, once it is full, a new stage growth times larger and
+    with an error rate tightening times lower is appended. A key is reported present if any stage
+    reports it, so the overall false positive rate stays around error_rate / (1 - tightening) at most.
+    """
+
+    def __init__(self, initial_capacity=1024, error_rate=0.01, growth=2, tightening=0.5):
+        """
+        Init the filter
+        :param initial_capacity: capacity of the first stage
+        :param error_rate: false positive rate of the first stage
+        :param growth: capacity ratio between a stage and the previous one
+        :param tightening: error rate ratio between a stage and the previous one
+        """
+        if not isinstance(growth, int) or growth < 1:
+            raise ValueError("growth must be a positive integer.")
+        if not isinstance(tightening, float) or not 0 < tightening < 1:
+            raise ValueError("tightening must be a float between 0 and 1.")
+
+        self._initialCapacity = initial_capacity
+        self._errorRate = error_rate
+        self._growth = growth
+        self._tightening = tightening
+        self._stages = [BloomFilter(initial_capacity, error_rate)]
+
+    def add(self, k):
+        """
+        Add key k to the filter, opening a new stage if the current one is full.
+        """
+        stage = self._stages[-1]
+        if stage.isFull():
+            stage = BloomFilter(stage.capacity() * self._growth,
+                                self._errorRate * self._tightening ** len(self._stages))
+            self._stages.append(stage)
+        stage.add(k)
+
+    def __contains__(self, k):
+        for stage in reversed(self._stages):
+            if k in stage:
+                return True
+        return False
+
+    def __len__(self):
+        return sum(len(stage) for stage in self._stages)
+
+    def stageCount(self):
+        return len(self._stages)
+
+    def currentErrorRate(self):
+        """
+        Returns the expected false positive rate given the number of keys added so far.
+        :return: float
+        """
+        passing = 1.0
+        for stage in self._stages:
+            passing *= 1 - stage.currentErrorRate()
+        return 1 - passing
+
+    def clear(self):
+        self._stages = [BloomFilter(self._initialCapacity, self._errorRate)]
+
+
+if __name__ == '__main__':
+    seen = ScalableBloomFilter(initial_capacity=1000, error_rate=0.01)
+    for n in range(0, 20000, 2):
+        seen.add(n)
+
+    falsePositives = sum(1 for n in range(1, 20000, 2) if n in seen)
+    print(seen.stageCount(), all(n in seen for n in range(0, 20000, 2)))
+    print(falsePositives / 10000, seen.currentErrorRate())
@@ -0,0 +1,248 @@
+
+from functools import wraps
+from AbstractBases.Map import Map as abstractMapBase
+from MapADT.ChainedHashTable import ChainedHashTable
+from LinkedListADT.LinkedPositionalList import LinkedPositionalList
+
+
+class CacheMap(abstractMapBase):
+    """
+    Class implements a bounded cache map. Keys are looked up in a ChainedHashTable whose values
+    are entries kept in LinkedPositionalList usage lists, so finding, refreshing and evicting
+    an entry all run in O(1) time. Once capacity entries are held, adding a new key evicts one
+    entry chosen by the eviction policy. Policy options:
+        LRU: 0    evict the least recently used entry. Every hit moves its entry to the front.
+        LFU: 1    evict the least frequently used entry, the least recently used one among ties.
+                  Entries are grouped by use count in a list of frequency groups ordered by
+                  ascending count, so a hit only moves its entry to the next group.
+        FIFO: 2   evict the oldest entry, hits do not change the order.
+
+    Reading through __getitem__ (and so get()) counts a hit or a miss and refreshes the entry;
+    `in` and peek() do neither.
+    """
+
+    LRU = 0
+    LFU = 1
+    FIFO = 2
+
+    class _Entry:
+        __slots__ = '_key', '_value', '_frequency', '_group', '_position'
+
+        def __init__(self, k, value):
+            self._key = k
+            self._value = value
+            self._frequency = 1
+            self._group = None  # position of the entry's frequency group (LFU only)
+            self._position = None  # position of the entry within its usage list
+
+    class _Group:
+        __slots__ = '_frequency', '_entries'
+
+        def __init__(self, frequency):
+            self._frequency = frequency
+            self._entries = LinkedPositionalList()
+
+    def __init__(self, capacity, policy=0, onEvict=None):
+        """
+        Init the cache
+        :param capacity: maximum number of entries
+        :param policy: eviction policy, LRU=0, LFU=1, FIFO=2
+        :param onEvict: function called with (key, value) of every evicted entry
+        """
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an integer.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if policy not in (self.LRU, self.LFU, self.FIFO):
+            raise ValueError("policy must be one of LRU=0, LFU=1 or FIFO=2.")
+
+        self.__capacity = capacity
+        self.__policy = policy
+        self.__onEvict = onEvict
+        self.__entries = ChainedHashTable()
+        self.__usage = LinkedPositionalList()  # entries, most recent first (LRU, FIFO)
+        self.__groups = LinkedPositionalList()  # frequency groups, least frequent first (LFU)
+        self.__hits = self.__misses = self.__evictions = 0
+
+    def __touch(self, entry):
+        """
+        Record a use of an entry according to the eviction policy.
+        """
+        if self.__policy == self.LRU:
+            self.__usage.remove(entry._position)
+            entry._position = self.__usage.addFirst(entry)
+        elif self.__policy == self.LFU:
+            group = entry._group.element()
+            nextGroup = self.__groups.after(entry._group)
+            entry._frequency += 1
+
+            if nextGroup is None or nextGroup.element()._frequency != entry._frequency:
+                nextGroup = self.__groups.addAfter(self._Group(entry._frequency), entry._group)
+
+            group._entries.remove(entry._position)
+            if group._entries.isEmpty():
+                self.__groups.remove(entry._group)
+
+            entry._group = nextGroup
+            entry._position = nextGroup.element()._entries.addFirst(entry)
+
+    def __link(self, entry):
+        """
+        Add a new entry to the usage lists.
+        """
+        if self.__policy == self.LFU:
+            first = self.__groups.first()
+            if first is None or first.element()._frequency != 1:
+                first = self.__groups.addFirst(self._Group(1))
+            entry._group = first
+            entry._position = first.element()._entries.addFirst(entry)
+        else:
+            entry._position = self.__usage.addFirst(entry)
+
+    def __unlink(self, entry):
+        """
+        Remove an entry from the usage lists.
+        """
+        if self.__policy == self.LFU:
+            entries = entry._group.element()._entries
+            entries.remove(entry._position)
+            if entries.isEmpty():
+                self.__groups.remove(entry._group)
+        else:
+            self.__usage.remove(entry._position)
+
+    def __evict(self):
+        """
+        Remove the entry chosen by the eviction policy and hand it to the onEvict callback.
+        """
+        if self.__policy == self.LFU:
+            entry = self.__groups.first().element()._entries.last().element()
+        else:
+            entry = self.__usage.last().element()
+
+        self.__unlink(entry)
+        del self.__entries[entry._key]
+        self.__evictions += 1
+
+        if self.__onEvict is not None:
+            self.__onEvict(entry._key, entry._value)
+
+    def __getitem__(self, k):
+        try:
+            entry = self.__entries[k]
+        except KeyError:
+            self.__misses += 1
+            raise
+
+        self.__hits += 1
+        self.__touch(entry)
+        return entry._value
+
+    def __setitem__(self, k, value):
+        try:
+            entry = self.__entries[k]
+        except KeyError:
+            entry = None
+
+        if entry is not None:
+            entry._value = value
+            self.__touch(entry)
+            return
+
+        if len(self.__entries) >= self.__capacity:
+            self.__evict()
+
+        entry = self._Entry(k, value)
+        self.__entries[k] = entry
+        self.__link(entry)
+
+    def __delitem__(self, k):
+        entry = self.__entries[k]
+        self.__unlink(entry)
+        del self.__entries[k]
+
+    def __contains__(self, k):
+        return k in self.__entries
+
+    def peek(self, k, default=None):
+        """
+        Return the value of key k, or default if absent, without counting a hit or a miss
+        nor refreshing the entry.
+        """
+        try:
+            return self.__entries[k]._value
+        except KeyError:
+            return default
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __iter__(self):
+        return iter(self.__entries)
+
+    def capacity(self):
+        return self.__capacity
+
+    def stats(self):
+        """
+        Returns the hit, miss and eviction counters.
+        :return: dict
+        """
+        return {'hits': self.__hits, 'misses': self.__misses, 'evictions': self.__evictions}
+
+    def clear(self):
+        self.__entries = ChainedHashTable()
+        self.__usage = LinkedPositionalList()
+        self.__groups = LinkedPositionalList()
+
+    @staticmethod
+    def memoize(capacity=128, policy=0):
+        """
+        Decorator caching the results of a pure function in a CacheMap of the given capacity
+        and policy, keyed by its arguments, which must be hashable. The cache is available as
+        the cache attribute of the decorated function.
+        e.g.
+            @CacheMap.memoize(capacity=1024)
+            def fib(n): ...
+        """
+        def decorator(function):
+            cache = CacheMap(capacity, policy)
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                key = args if not kwargs else (args, frozenset(kwargs.items()))
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+
+                result = function(*args, **kwargs)
+                cache[key] = result
+                return result
+
+            wrapper.cache = cache
+            return wrapper
+
+        return decorator
+
+
+if __name__ == '__main__':
+    evicted = []
+    cache = CacheMap(3, policy=CacheMap.LFU, onEvict=lambda k, v: evicted.append(k))
+
+    cache['a'] = 1
+    cache['b'] = 2
+    cache['c'] = 3
+    cache['a']
+    cache['a']
+    cache['b']
+    cache['d'] = 4
+    cache['e'] = 5
+
+    print(sorted(cache.items()), evicted, cache.stats())
+
+    @CacheMap.memoize(capacity=256)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(fibonacci(200), fibonacci.cache.stats())
@@ -1,50 +1,221 @@
 
+from collections.abc import ItemsView, ValuesView
 from AbstractBases.HashTable import HashTable as hashTableBase
 from MapADT.UnsortedMap import UnsortedMap
 
 
 class ChainedHashTable(hashTableBase):
+    """
+    Class implements an HashTable via separate chaining, every bucket being an UnsortedMap.
+
+    A bucket left empty by a delete is dropped at once. With a shrink_factor, the table also
+    shrinks once its load falls below shrink_factor, back to half the load factor, though never
+    below its initial size. Growing from there takes the load up to load_factor and shrinking
+    down to shrink_factor, both far from the new load, so a table hovering around a threshold
+    does not resize back and forth. compact() shrinks the table to fit on demand.
+
+    During an incremental resize only writes move buckets to the new table. Reads look the key
+    up in its old bucket if that one was not moved yet, and in the new table otherwise, so
+    iterating over the table while reading from it never misses nor repeats an item.
+    """
+
+    class _ItemsView(ItemsView):
+        def __iter__(self):
+            for bucket in self._mapping._buckets():
+                for item in bucket._items():
+                    yield item._key, item._value
+
+    class _ValuesView(ValuesView):
+        def __iter__(self):
+            for bucket in self._mapping._buckets():
+                for item in bucket._items():
+                    yield item._value
+
+    _countsProbes = True
+
+    def __init__(self, load_factor=0.5, table_size=11, p=137, migration_step=None, shrink_factor=None):
+        """
+        Init the table
+        :param shrink_factor: load under which the table shrinks, None to never shrink on delete.
+                              Must not exceed load_factor / 4.
+        """
+        super().__init__(load_factor, table_size, p, migration_step)
+        if shrink_factor is not None:
+            if not (isinstance(shrink_factor, int) or isinstance(shrink_factor, float)):
+                raise TypeError("shrink_factor must be a number.")
+            if not 0 < shrink_factor <= load_factor / 4:
+                raise ValueError("shrink_factor must be positive and at most load_factor / 4.")
+        self._shrinkFactor = shrink_factor
 
     def __setitem__(self, k, value):
-        bucketIndex = self._hashFunction(k)
-        if self._table[bucketIndex] is None:
-            self._table[bucketIndex] = UnsortedMap()
-
-        oldLen = len(self._table[bucketIndex])
-        self._table[bucketIndex][k] = value
-
-        if oldLen != len(self._table[bucketIndex]):
+        h = hash(k)
+        if self._oldTable is not None:
+            self._migrate(h)
+
+        bucketIndex = self._compress(h)
+        bucket = self._table[bucketIndex]
+        if bucket is None:
+            bucket = self._table[bucketIndex] = UnsortedMap()
+
+        if self._stats is not None:
+            item, probes = bucket._locate(k, h)
+            self._recordProbes('set', probes)
+            if item is not None:
+                item._value = value
+            else:
+                bucket._appendItem(self._Item(k, value, h))
+                self._size += 1
+        elif bucket._setWithHash(k, value, h):
             self._size += 1
 
         if self._size / len(self._table) > self._loadFactor:
-            if len(self._table) < 50000:
-                self._resize(len(self._table) * 3)
-            else:
-                self._resize(len(self._table) * 2)
+            self._resize(self._grownCapacity())
+
+    def __bucketOf(self, h):
+        """
+        Returns the bucket a key of hash value h is in, or would be in, without moving any bucket:
+        its old bucket while that one is still in the old table, its new bucket otherwise.
+        A write to the key would have moved its old bucket, so the key cannot be in both.
+        """
+        if self._oldTable is not None:
+            bucket = self._oldTable[self._oldIndex(h)]
+            if bucket is not None:
+                return bucket
+        return self._table[self._compress(h)]
 
     def __getitem__(self, k):
-        bucketIndex = self._hashFunction(k)
+        h = hash(k)
+        bucket = self.__bucketOf(h)
+
+        if self._stats is not None:
+            item, probes = bucket._locate(k, h) if bucket is not None else (None, 0)
+            self._recordProbes('get', probes)
+            if item is None:
+                raise KeyError("KeyError: " + repr(k))
+            return item._value
 
-        if self._table[bucketIndex] is None:
+        if bucket is None:
             raise KeyError("KeyError: " + repr(k))
-        return self._table[bucketIndex][k]
+        return bucket._getWithHash(k, h)
 
     def __delitem__(self, k):
-        bucketIndex = self._hashFunction(k)
-        if self._table[bucketIndex] is None:
+        h = hash(k)
+        if self._oldTable is not None:
+            self._migrate(h)
+
+        bucketIndex = self._compress(h)
+        bucket = self._table[bucketIndex]
+        if bucket is None:
             raise KeyError("KeyError: " + repr(k))
-        del self._table[bucketIndex][k]
+        bucket._deleteWithHash(k, h)
         self._size -= 1
 
-    def __iter__(self):
+        if not len(bucket):
+            self._table[bucketIndex] = None
+
+        if self._shrinkFactor is not None and self._size / len(self._table) < self._shrinkFactor \
+                and len(self._table) > self._initialTableSize:
+            self._resize(self.__fittedCapacity())
+
+    def __fittedCapacity(self):
+        """
+        Returns the capacity at which the table is half as loaded as the load factor allows,
+        but not below the initial size.
+        """
+        return max(self._initialTableSize, int(self._size / (self._loadFactor / 2)) + 1)
+
+    def compact(self):
+        """
+        Complete any incremental resize in progress, then shrink the table to the capacity that
+        fits its items at half the load factor if it is larger, in O(n) time, whatever the
+        shrink policy.
+        """
+        if self._oldTable is not None:
+            self._migrate(steps=len(self._oldTable))
+
+        capacity = self.__fittedCapacity()
+        if capacity < len(self._table):
+            self._resize(capacity)
+            if self._oldTable is not None:
+                self._migrate(steps=len(self._oldTable))
+
+    def _buckets(self):
+        """
+        Returns a generator over the non empty buckets of the new table then of the old one.
+        """
         for bucket in self._table:
             if bucket is not None:
-                for key in bucket:
-                    yield key
+                yield bucket
+
+        if self._oldTable is not None:
+            for bucket in self._oldTable:
+                if bucket is not None:
+                    yield bucket
+
+    def __iter__(self):
+        for bucket in self._buckets():
+            for item in bucket._items():
+                yield item._key
+
+    def items(self):
+        return self._ItemsView(self)
+
+    def values(self):
+        return self._ValuesView(self)
+
+    def _bulkSet(self, pairs):
+        # the table was pre-sized by _reserve(), so there is no load factor check nor migration here
+        table = self._table
+        a, b, p, capacity = self._a, self._b, self._p, len(table)
+        added = 0
+
+        for k, value in pairs:
+            h = hash(k)
+            bucketIndex = (h * a + b) % p % capacity
+            bucket = table[bucketIndex]
+            if bucket is None:
+                bucket = table[bucketIndex] = UnsortedMap()
+            if bucket._setWithHash(k, value, h):
+                added += 1
+
+        self._size += added
+
+    def getMany(self, keys, default=None):
+        if self._oldTable is not None:
+            return super().getMany(keys, default)
+
+        table = self._table
+        a, b, p, capacity = self._a, self._b, self._p, len(table)
+        values = []
+
+        for k in keys:
+            h = hash(k)
+            bucket = table[(h * a + b) % p % capacity]
+            if bucket is None:
+                values.append(default)
+                continue
+            try:
+                values.append(bucket._getWithHash(k, h))
+            except KeyError:
+                values.append(default)
+
+        return values
+
+    def _chainLengths(self):
+        return (0 if bucket is None else len(bucket) for bucket in self._table)
+
+    def _migrateBucket(self, bucket):
+        # items are moved as they are, their cached hash values give the new bucket straight away
+        table = self._table
+        for item in bucket._items():
+            bucketIndex = self._compress(item._hash)
+            if table[bucketIndex] is None:
+                table[bucketIndex] = UnsortedMap()
+            table[bucketIndex]._appendItem(item)
 
 
 if __name__ == '__main__':
-    d = ChainedHashTable()
+    d = ChainedHashTable(migration_step=4)
 
     d['microsoft'] = 'c#'
     d['oracle'] = 'java'
@@ -55,6 +226,8 @@ if __name__ == '__main__':
     d['google2'] = 'angularJS'
     d['square'] = 'picasso'
 
+    print(d.isMigrating(), d.migrationProgress())
+
     for j in d.items():
         print(j)
 
@@ -0,0 +1,179 @@
+
+from array import array
+from AbstractBases.HashTable import HashTable as hashTableBase
+
+
+class CompactHashTable(hashTableBase):
+    """
+    Class implements a compact, insertion ordered HashTable in the spirit of CPython's dict.
+    The table is split in two:
+        _table: a small integer index array of the hash table capacity. Each slot holds the
+                position of an entry, -1 for a slot never used or -2 for a deleted slot.
+        _hashes, _keys, _values: dense entries arrays appended to in insertion order.
+    The index array uses the smallest integer type able to address the entries, so an empty
+    slot costs 1 to 8 bytes rather than a bucket object, and iteration walks the dense entries
+    in insertion order without going over empty buckets.
+
+    Collisions in the index are resolved by linear probing. Deleted entries leave a hole in the
+    entries arrays until the next rebuild, which compacts them out.
+    """
+
+    __EMPTY = -1
+    __DUMMY = -2
+    __DELETED = object()  # marker left in _keys for a deleted entry
+
+    def __init__(self, load_factor=0.5, table_size=11, p=137):
+        self._validateOpenLoadFactor(load_factor)
+        super().__init__(load_factor, table_size, p)
+        self._table = self.__newIndex(table_size)
+        self._hashes = []
+        self._keys = []
+        self._values = []
+
+    def __newIndex(self, capacity):
+        """
+        Returns an index array of capacity empty slots using the smallest signed integer type
+        able to hold every entry position.
+        :param capacity: capacity of the index
+        :return: array
+        """
+        if capacity < 2 ** 7:
+            typeCode = 'b'
+        elif capacity < 2 ** 15:
+            typeCode = 'h'
+        elif capacity < 2 ** 31:
+            typeCode = 'i'
+        else:
+            typeCode = 'q'
+        return array(typeCode, [self.__EMPTY]) * capacity
+
+    def __lookup(self, k, h):
+        """
+        Probe the index for key k with hash value h.
+        :return: tuple (entry, slot). entry is the position of k in the entries arrays or -1 if
+                 k is absent, in which case slot is the index slot k should be stored at.
+        """
+        index = self._table
+        hashes = self._hashes
+        keys = self._keys
+        capacity = len(index)
+        j = self._compress(h)
+        freeSlot = None
+
+        while True:
+            entry = index[j]
+            if entry == self.__EMPTY:
+                return -1, (j if freeSlot is None else freeSlot)
+
+            if entry == self.__DUMMY:
+                if freeSlot is None:
+                    freeSlot = j
+            elif hashes[entry] == h:
+                key = keys[entry]
+                if key is k or key == k:
+                    return entry, j
+
+            j += 1
+            if j == capacity:
+                j = 0
+
+    def __setitem__(self, k, value):
+        h = hash(k)
+        entry, slot = self.__lookup(k, h)
+
+        if entry >= 0:
+            self._values[entry] = value
+            return
+
+        self._table[slot] = len(self._keys)
+        self._hashes.append(h)
+        self._keys.append(k)
+        self._values.append(value)
+        self._size += 1
+
+        # every used index slot, deleted or not, has an entry so this also bounds the probe length
+        capacity = len(self._table)
+        if len(self._keys) / capacity > self._loadFactor:
+            if self._size / capacity > self._loadFactor / 2:
+                self._resize(self._grownCapacity())
+            else:
+                self._resize(capacity)
+
+    def __getitem__(self, k):
+        entry = self.__lookup(k, hash(k))[0]
+
+        if entry < 0:
+            raise KeyError("KeyError: " + repr(k))
+        return self._values[entry]
+
+    def __delitem__(self, k):
+        entry, slot = self.__lookup(k, hash(k))
+
+        if entry < 0:
+            raise KeyError("KeyError: " + repr(k))
+
+        self._table[slot] = self.__DUMMY
+        self._hashes[entry] = None
+        self._keys[entry] = self.__DELETED
+        self._values[entry] = None
+        self._size -= 1
+
+    def __contains__(self, k):
+        return self.__lookup(k, hash(k))[0] >= 0
+
+    def __iter__(self):
+        deleted = self.__DELETED
+        for key in self._keys:
+            if key is not deleted:
+                yield key
+
+    def _resize(self, newCapacity):
+        """
+        Compact the entries arrays and rebuild the index at newCapacity slots.
+        Runs in O(n) time reusing the cached hash values.
+        """
+        if len(self._keys) != self._size:
+            deleted = self.__DELETED
+            live = [cursor for cursor in range(len(self._keys)) if self._keys[cursor] is not deleted]
+            self._hashes = [self._hashes[cursor] for cursor in live]
+            self._keys = [self._keys[cursor] for cursor in live]
+            self._values = [self._values[cursor] for cursor in live]
+
+        self._adjustPrime(newCapacity)
+        self._table = index = self.__newIndex(newCapacity)
+        empty = self.__EMPTY
+
+        for entry, h in enumerate(self._hashes):
+            j = self._compress(h)
+            while index[j] != empty:
+                j += 1
+                if j == newCapacity:
+                    j = 0
+            index[j] = entry
+
+    def clear(self):
+        super().clear()
+        self._table = self.__newIndex(self._initialTableSize)
+        self._hashes = []
+        self._keys = []
+        self._values = []
+
+
+if __name__ == '__main__':
+    d = CompactHashTable()
+
+    d['microsoft'] = 'c#'
+    d['oracle'] = 'java'
+    d['google'] = 'go'
+    d['apple'] = 'swift'
+    d['yahoo'] = 'YUI'
+    d['mozilla'] = 'javascript'
+    d['google2'] = 'angularJS'
+    d['square'] = 'picasso'
+
+    del d['oracle']
+
+    for j in d.items():
+        print(j)
+
+    print(len(d))
@@ -0,0 +1,226 @@
+
+from collections.abc import ItemsView, Mapping, ValuesView
+from threading import RLock
+from AbstractBases.Map import Map as abstractMapBase
+from MapADT.ChainedHashTable import ChainedHashTable
+
+
+class ConcurrentHashMap(abstractMapBase):
+    """
+    Class implements a thread safe map by splitting the key space into a number of shards,
+    each one a ChainedHashTable guarded by its own lock. A key always lives in shard
+    hash(k) mod shards, so threads working on keys of different shards never wait on each other
+    and every shard resizes on its own, without stalling the others.
+
+    Single key operations, including computeIfAbsent, getOrDefault, compute, setdefault, pop
+    and popitem, are atomic. Iterating over keys, values or items and len() are not a consistent
+    snapshot of the whole map: each shard is copied in turn under its own lock, so every item
+    seen was in the map at some point, but items changed in a shard already copied are missed.
+    update() stores the items of every shard under its lock at once.
+    """
+
+    class _ItemsView(ItemsView):
+        def __iter__(self):
+            return self._mapping._pairs()
+
+    class _ValuesView(ValuesView):
+        def __iter__(self):
+            for key, value in self._mapping._pairs():
+                yield value
+
+    def __init__(self, shards=16, load_factor=0.5, table_size=11, migration_step=None):
+        """
+        Init the map
+        :param shards: number of independently locked ChainedHashTable shards
+        :param load_factor, table_size, migration_step: see HashTable, used for every shard
+        """
+        if not isinstance(shards, int):
+            raise TypeError("shards must be an integer.")
+        if shards < 1:
+            raise ValueError("shards must be at least 1.")
+
+        self.__shards = [ChainedHashTable(load_factor, table_size, migration_step=migration_step)
+                         for i in range(shards)]
+        self.__locks = [RLock() for i in range(shards)]
+
+    def __shardIndex(self, k):
+        return hash(k) % len(self.__shards)
+
+    def __setitem__(self, k, value):
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            self.__shards[i][k] = value
+
+    def __getitem__(self, k):
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            return self.__shards[i][k]
+
+    def __delitem__(self, k):
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            del self.__shards[i][k]
+
+    def __contains__(self, k):
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            return k in self.__shards[i]
+
+    def getOrDefault(self, k, default=None):
+        """
+        Return the value of key k, or default if k is not in the map.
+        """
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            try:
+                return self.__shards[i][k]
+            except KeyError:
+                return default
+
+    def computeIfAbsent(self, k, mappingFunction):
+        """
+        Return the value of key k. If k is not in the map, mappingFunction(k) is called and its
+        result stored under k before being returned. The whole operation is atomic, so
+        mappingFunction is called at most once per missing key.
+        :param mappingFunction: function computing the value of a missing key
+        :return: object
+        """
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            shard = self.__shards[i]
+            try:
+                return shard[k]
+            except KeyError:
+                value = mappingFunction(k)
+                shard[k] = value
+                return value
+
+    def compute(self, k, remappingFunction):
+        """
+        Atomically replace the value of key k by remappingFunction(k, oldValue), oldValue being
+        None if k is not in the map yet.
+        :param remappingFunction: function computing the new value from the key and its old value
+        :return: the new value
+        """
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            shard = self.__shards[i]
+            try:
+                oldValue = shard[k]
+            except KeyError:
+                oldValue = None
+            value = remappingFunction(k, oldValue)
+            shard[k] = value
+            return value
+
+    def setdefault(self, k, default=None):
+        return self.computeIfAbsent(k, lambda key: default)
+
+    __MISSING = object()
+
+    def pop(self, k, default=__MISSING):
+        """
+        Atomically remove key k and return its value, or default if k is not in the map.
+        :exception raise a KeyError if k is not in the map and no default is given
+        """
+        i = self.__shardIndex(k)
+        with self.__locks[i]:
+            shard = self.__shards[i]
+            try:
+                value = shard[k]
+            except KeyError:
+                if default is self.__MISSING:
+                    raise
+                return default
+            del shard[k]
+            return value
+
+    def popitem(self):
+        """
+        Atomically remove an item and return it as a (key, value) tuple.
+        :exception raise a KeyError if the map is empty
+        """
+        for i in range(len(self.__shards)):
+            with self.__locks[i]:
+                shard = self.__shards[i]
+                for key in shard:
+                    value = shard[key]
+                    del shard[key]
+                    return key, value
+        raise KeyError("The map is empty.")
+
+    def update(self, other=(), **kwargs):
+        """
+        Store the items of a Mapping or an iterable of (key, value) pairs, then of kwargs. The
+        items of every shard are stored under its lock at once.
+        """
+        if isinstance(other, ConcurrentHashMap):
+            other = list(other.items())
+        elif isinstance(other, Mapping):
+            other = [(k, other[k]) for k in other]
+
+        batches = [[] for i in range(len(self.__shards))]
+        for k, value in other:
+            batches[self.__shardIndex(k)].append((k, value))
+        for k, value in kwargs.items():
+            batches[self.__shardIndex(k)].append((k, value))
+
+        for i, batch in enumerate(batches):
+            if batch:
+                with self.__locks[i]:
+                    self.__shards[i].updateMany(batch)
+
+    def __len__(self):
+        total = 0
+        for i in range(len(self.__shards)):
+            with self.__locks[i]:
+                total += len(self.__shards[i])
+        return total
+
+    def __iter__(self):
+        for i in range(len(self.__shards)):
+            with self.__locks[i]:
+                keys = list(self.__shards[i])
+            for key in keys:
+                yield key
+
+    def _pairs(self):
+        """
+        Returns a generator over the (key, value) pairs of the map, copying every shard under
+        its lock.
+        """
+        for i in range(len(self.__shards)):
+            with self.__locks[i]:
+                pairs = list(self.__shards[i].items())
+            for pair in pairs:
+                yield pair
+
+    def items(self):
+        return self._ItemsView(self)
+
+    def values(self):
+        return self._ValuesView(self)
+
+    def clear(self):
+        for i in range(len(self.__shards)):
+            with self.__locks[i]:
+                self.__shards[i].clear()
+
+
+if __name__ == '__main__':
+    from concurrent.futures import ThreadPoolExecutor
+
+    counts = ConcurrentHashMap(shards=8)
+
+    def countWords(words):
+        for word in words:
+            counts.compute(word, lambda k, old: 1 if old is None else old + 1)
+
+    text = ('the quick brown fox jumps over the lazy dog ' * 1000).split()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for cursor in range(0, len(text), 500):
+            pool.submit(countWords, text[cursor:cursor + 500])
+
+    print(sorted(counts.items()))
+    print(counts.getOrDefault('cat', 0))
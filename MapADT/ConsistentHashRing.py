@@ -0,0 +1,98 @@
+
+from bisect import bisect_right
+from MapADT._StableHash import StableHash
+
+
+class ConsistentHashRing():
+    """
+    Class implements consistent hashing: nodes and keys are hashed onto the same ring of 63 bits
+    hash values, and a key belongs to the first node point found clockwise from its own hash.
+    Every node is placed at replicas * weight points (virtual nodes), so its share of the keys is
+    proportional to its weight and evenly spread around the ring.
+
+    Adding a node only takes over the keys falling just before its new points, about
+    weight / total weight of them, and removing one only hands its own keys over to the nodes
+    that follow; every other key stays where it is, unlike with hash(k) mod N placement.
+
+    Points are StableHash values, so every process builds the same ring from the same nodes.
+    Nodes must be picklable. Keys equal by == that StableHash.of() hashes alike, such as 1, 1.0
+    and True, belong to the same node.
+    """
+
+    def __init__(self, replicas=100):
+        """
+        Init the ring
+        :param replicas: number of points of a node of weight 1
+        """
+        if not isinstance(replicas, int) or replicas < 1:
+            raise ValueError("replicas must be a positive integer.")
+
+        self.__replicas = replicas
+        self.__weights = {}  # node -> weight
+        self.__points = []  # sorted hash values of all the points
+        self.__owners = []  # node of every point, in the order of __points
+
+    def __rebuild(self):
+        ring = []
+        for node, weight in self.__weights.items():
+            for replica in range(max(1, round(self.__replicas * weight))):
+                ring.append((StableHash.of((node, replica)), node))
+
+        ring.sort(key=lambda point: point[0])
+        self.__points = [point for point, node in ring]
+        self.__owners = [node for point, node in ring]
+
+    def addNode(self, node, weight=1):
+        """
+        Place a node on the ring, or change its weight if it is already there.
+        :param weight: relative share of the keys the node should own
+        """
+        if not (isinstance(weight, int) or isinstance(weight, float)) or weight <= 0:
+            raise ValueError("weight must be a positive number.")
+        self.__weights[node] = weight
+        self.__rebuild()
+
+    def removeNode(self, node):
+        """
+        Take a node off the ring.
+        :exception raise a KeyError if node is not on the ring
+        """
+        if node not in self.__weights:
+            raise KeyError("KeyError: " + repr(node))
+        del self.__weights[node]
+        self.__rebuild()
+
+    def nodeFor(self, k):
+        """
+        Returns the node key k belongs to.
+        :exception raise a LookupError if the ring has no node
+        """
+        if not self.__points:
+            raise LookupError("The ring has no node.")
+        i = bisect_right(self.__points, StableHash.of(k))
+        return self.__owners[i % len(self.__owners)]
+
+    def weight(self, node):
+        return self.__weights[node]
+
+    def nodes(self):
+        return list(self.__weights)
+
+    def __contains__(self, node):
+        return node in self.__weights
+
+    def __len__(self):
+        return len(self.__weights)
+
+
+if __name__ == '__main__':
+    ring = ConsistentHashRing()
+    for server in ('cache-a', 'cache-b', 'cache-c'):
+        ring.addNode(server)
+
+    keys = ['user:%d' % n for n in range(10000)]
+    before = {k: ring.nodeFor(k) for k in keys}
+
+    ring.addNode('cache-d', weight=2)
+    moved = sum(1 for k in keys if ring.nodeFor(k) != before[k])
+    print(moved / len(keys))
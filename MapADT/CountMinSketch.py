@@ -0,0 +1,148 @@
+
+from array import array
+from math import ceil, e, log
+from random import Random
+from MapADT._StableHash import StableHash
+
+
+class CountMinSketch():
+    """
+    Class implements a count-min sketch: approximate frequency counts of a stream of keys in
+    fixed memory, whatever the number of distinct keys. It keeps depth rows of width counters;
+    adding a key increments one counter per row, picked by a MAD compression of its hash value
+    seeded per row, and the estimate of a key is the smallest of its depth counters.
+
+    Estimates never undercount. With width = ceil(e / epsilon) and depth = ceil(ln(1 / delta)),
+    an estimate exceeds the true count by more than epsilon * total() with probability at most
+    delta.
+
+    Keys are hashed with StableHash and the row seeds derive from seed only, so sketches built
+    with the same width, depth and seed in different processes can be merged by adding up their
+    counters, e.g. to aggregate per worker sketches.
+    """
+
+    __P = 2 ** 61 - 1
+
+    def __init__(self, width=2048, depth=5, seed=0):
+        """
+        Init the sketch
+        :param width: number of counters per row
+        :param depth: number of rows
+        :param seed: seed of the row hash functions, shared by sketches meant to be merged
+        """
+        if not isinstance(width, int) or not isinstance(depth, int):
+            raise TypeError("width and depth must be integers.")
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1.")
+
+        self._width = width
+        self._depth = depth
+        self._seed = seed
+        generator = Random(seed)
+        self._seeds = [(generator.randrange(1, self.__P), generator.randrange(0, self.__P))
+                       for row in range(depth)]
+        self._counters = array('q', bytes(8 * width * depth))
+        self._total = 0
+
+    @classmethod
+    def fromErrorBounds(cls, epsilon, delta, seed=0):
+        """
+        Build a sketch whose estimates exceed the true counts by at most epsilon * total()
+        with probability 1 - delta.
+        :return: CountMinSketch
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1.")
+        return cls(ceil(e / epsilon), ceil(log(1 / delta)), seed)
+
+    def __cells(self, k):
+        """
+        Returns the index of the counter of key k in every row.
+        :return: list of int
+        """
+        h = StableHash.of(k)
+        p = self.__P
+        width = self._width
+        return [row * width + (a * h + b) % p % width for row, (a, b) in enumerate(self._seeds)]
+
+    def add(self, k, count=1):
+        """
+        Count count more occurrences of key k.
+        :return: the new estimate of k
+        """
+        if count < 0:
+            raise ValueError("count must not be negative.")
+
+        counters = self._counters
+        estimate = None
+        for cell in self.__cells(k):
+            counters[cell] += count
+            if estimate is None or counters[cell] < estimate:
+                estimate = counters[cell]
+
+        self._total += count
+        return estimate
+
+    def estimate(self, k):
+        """
+        Returns the estimated number of occurrences of key k, never less than the true count.
+        :return: int
+        """
+        counters = self._counters
+        return min(counters[cell] for cell in self.__cells(k))
+
+    def __getitem__(self, k):
+        return self.estimate(k)
+
+    def total(self):
+        """
+        Returns the total of all counts added.
+        :return: int
+        """
+        return self._total
+
+    def isCompatible(self, other):
+        """
+        Checks if other has the same shape and seed, so both sketches can be merged.
+        :return: boolean
+        """
+        return (isinstance(other, CountMinSketch) and self._width == other._width
+                and self._depth == other._depth and self._seed == other._seed)
+
+    def merge(self, other):
+        """
+        Add the counts of another sketch to this one. The result is the sketch of both streams.
+        :param other: CountMinSketch of the same width, depth and seed
+        :return: self
+        """
+        if not self.isCompatible(other):
+            raise ValueError("Only sketches of the same width, depth and seed can be merged.")
+
+        counters = self._counters
+        for cell, count in enumerate(other._counters):
+            if count:
+                counters[cell] += count
+        self._total += other._total
+        return self
+
+    def clear(self):
+        self._counters = array('q', bytes(8 * self._width * self._depth))
+        self._total = 0
+
+
+if __name__ == '__main__':
+    from random import paretovariate
+
+    sketches = [CountMinSketch.fromErrorBounds(0.001, 0.01, seed=7) for worker in range(4)]
+    truth = {}
+    for n in range(40000):
+        page = '/page/%d' % int(paretovariate(1.2))
+        truth[page] = truth.get(page, 0) + 1
+        sketches[n % 4].add(page)
+
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    for page in sorted(truth, key=truth.get, reverse=True)[:5]:
+        print(page, truth[page], merged.estimate(page))
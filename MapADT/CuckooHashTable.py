@@ -0,0 +1,263 @@
+
+from random import randrange
+from AbstractBases.HashTable import HashTable as hashTableBase
+
+
+class CuckooHashTable(hashTableBase):
+    """
+    Class implements an HashTable via cuckoo hashing.
+    The table is split into d sub-tables of equal capacity, each addressed by its own MAD
+    compression function [(ai*h + bi) mod p] mod N; all of them share the prime p of the
+    HashTable and the first one uses its a and b. A key can only live in one of its d candidate
+    slots or in a small stash, so a lookup probes at most d slots plus stash_size stash entries:
+    O(1) in the worst case.
+
+    Inserting into a full candidate slot evicts its resident, which moves to one of its own other
+    candidate slots, possibly evicting another item and so on. When such a walk goes on for too
+    long, the homeless item goes to the stash. Once the stash is full too, the whole table is
+    rehashed with new random a and b, and grown if that keeps failing.
+
+    Two sub-tables work well up to a load factor of about 0.5, three or more up to about 0.9.
+
+    Since (ai*h + bi) mod p only depends on h mod p, every compression function sends keys
+    congruent modulo p to the same slots, so p must be far larger than the number of keys for the
+    sub-tables to be addressed independently. p therefore defaults to the Mersenne prime 2^61 - 1.
+    """
+
+    __REHASH_ATTEMPTS = 3
+
+    def __init__(self, load_factor=0.45, table_size=11, p=2 ** 61 - 1, d=2, stash_size=4):
+        if not isinstance(d, int):
+            raise TypeError("d must be an integer.")
+        if d < 2:
+            raise ValueError("d must be at least 2.")
+        if not isinstance(stash_size, int):
+            raise TypeError("stash_size must be an integer.")
+        if stash_size < 0:
+            raise ValueError("stash_size must not be negative.")
+
+        super().__init__(load_factor, table_size * d, p)
+        self._d = d
+        self._subTableSize = table_size
+        self._stashSize = stash_size
+        self._stash = []  # list of (key, value, hash)
+        self._values = [None] * len(self._table)
+        self._hashes = [None] * len(self._table)
+        self._seeds = [(self._a, self._b)] + [self.__newSeed() for i in range(d - 1)]
+
+    def __newSeed(self):
+        return randrange(1, self._p), randrange(0, self._p)
+
+    def __slot(self, h, i):
+        """
+        Returns the candidate slot of hash value h in sub-table i.
+        """
+        a, b = self._seeds[i]
+        return (h * a + b) % self._p % self._subTableSize + i * self._subTableSize
+
+    def __find(self, k, h):
+        """
+        Returns the slot holding key k, -1 - its stash position if k is in the stash,
+        or None if k is absent.
+        """
+        table = self._table
+        hashes = self._hashes
+
+        for i in range(self._d):
+            j = self.__slot(h, i)
+            if hashes[j] == h and (table[j] is k or table[j] == k):
+                return j
+
+        for cursor in range(len(self._stash)):
+            key, value, keyHash = self._stash[cursor]
+            if keyHash == h and (key is k or key == k):
+                return -1 - cursor
+
+        return None
+
+    def __evictionLimit(self):
+        return max(16, 6 * self._subTableSize.bit_length())
+
+    def __place(self, k, value, h):
+        """
+        Store an item known to be absent from the table proper, evicting residents as needed.
+        :return: None on success, otherwise the (key, value, hash) item left homeless.
+        """
+        table = self._table
+        values = self._values
+        hashes = self._hashes
+        d = self._d
+
+        for i in range(d):
+            j = self.__slot(h, i)
+            if hashes[j] is None:
+                table[j], values[j], hashes[j] = k, value, h
+                return None
+
+        i = randrange(d)
+        for step in range(self.__evictionLimit()):
+            j = self.__slot(h, i)
+            k, table[j] = table[j], k
+            value, values[j] = values[j], value
+            h, hashes[j] = hashes[j], h
+
+            for other in range(d):
+                if other != i:
+                    j = self.__slot(h, other)
+                    if hashes[j] is None:
+                        table[j], values[j], hashes[j] = k, value, h
+                        return None
+
+            other = randrange(d - 1)
+            i = other if other < i else other + 1
+
+        return k, value, h
+
+    def __setitem__(self, k, value):
+        h = hash(k)
+        j = self.__find(k, h)
+
+        if j is not None:
+            if j >= 0:
+                self._values[j] = value
+            else:
+                self._stash[-1 - j] = (k, value, h)
+            return
+
+        self._size += 1
+        homeless = self.__place(k, value, h)
+
+        if homeless is not None:
+            if len(self._stash) < self._stashSize:
+                self._stash.append(homeless)
+            else:
+                self.__rebuild(self._subTableSize, homeless)
+                return
+
+        if self._size / len(self._table) > self._loadFactor:
+            self._resize(self._grownCapacity())
+
+    def __getitem__(self, k):
+        h = hash(k)
+        j = self.__find(k, h)
+
+        if j is None:
+            raise KeyError("KeyError: " + repr(k))
+        if j >= 0:
+            return self._values[j]
+        return self._stash[-1 - j][1]
+
+    def __delitem__(self, k):
+        h = hash(k)
+        j = self.__find(k, h)
+
+        if j is None:
+            raise KeyError("KeyError: " + repr(k))
+
+        if j >= 0:
+            self._table[j] = self._values[j] = self._hashes[j] = None
+            self.__drainStash()
+        else:
+            self._stash.pop(-1 - j)
+
+        self._size -= 1
+
+    def __drainStash(self):
+        """
+        Move stash items back into the table proper when one of their candidate slots is free.
+        """
+        hashes = self._hashes
+        for cursor in range(len(self._stash) - 1, -1, -1):
+            k, value, h = self._stash[cursor]
+            for i in range(self._d):
+                j = self.__slot(h, i)
+                if hashes[j] is None:
+                    self._table[j], self._values[j], hashes[j] = k, value, h
+                    self._stash.pop(cursor)
+                    break
+
+    def __contains__(self, k):
+        return self.__find(k, hash(k)) is not None
+
+    def __iter__(self):
+        for key, h in zip(self._table, self._hashes):
+            if h is not None:
+                yield key
+
+        for key, value, h in list(self._stash):
+            yield key
+
+    def _grownCapacity(self):
+        if self._subTableSize < 50000:
+            return self._subTableSize * 3
+        return self._subTableSize * 2
+
+    def _capacityFor(self, n):
+        needed = int(n / self._loadFactor / self._d) + 1
+        if needed > self._subTableSize:
+            return needed
+        return None
+
+    def _resize(self, newCapacity):
+        """
+        Rebuild the table with sub-tables of newCapacity slots each.
+        :param newCapacity: capacity of each sub-table
+        """
+        self.__rebuild(newCapacity, None)
+
+    def __rebuild(self, subTableSize, extraItem):
+        """
+        Re-insert every item with new seeds, growing the sub-tables whenever
+        __REHASH_ATTEMPTS rounds in a row fail to fit every item in the table and the stash.
+        :param extraItem: (key, value, hash) item to be added, or None
+        """
+        items = [(k, v, h) for k, v, h in zip(self._table, self._values, self._hashes) if h is not None]
+        items.extend(self._stash)
+        if extraItem is not None:
+            items.append(extraItem)
+
+        attempts = 0
+        while True:
+            if attempts == self.__REHASH_ATTEMPTS:
+                subTableSize = subTableSize * 2
+                attempts = 0
+            attempts += 1
+
+            capacity = subTableSize * self._d
+            self._adjustPrime(subTableSize)
+            self._subTableSize = subTableSize
+            self._table = [None] * capacity
+            self._values = [None] * capacity
+            self._hashes = [None] * capacity
+            self._stash = []
+            self._seeds = [self.__newSeed() for i in range(self._d)]
+            self._a, self._b = self._seeds[0]
+
+            for k, v, h in items:
+                homeless = self.__place(k, v, h)
+                if homeless is not None:
+                    if len(self._stash) == self._stashSize:
+                        break
+                    self._stash.append(homeless)
+            else:
+                return
+
+    def clear(self):
+        super().clear()
+        self._subTableSize = self._initialTableSize // self._d
+        self._values = [None] * self._initialTableSize
+        self._hashes = [None] * self._initialTableSize
+        self._stash = []
+
+
+if __name__ == '__main__':
+    d = CuckooHashTable(d=3, load_factor=0.85)
+
+    for i in range(10000):
+        d['key-%s' % i] = i
+
+    for i in range(0, 10000, 3):
+        del d['key-%s' % i]
+
+    print(len(d))
+    print(d['key-1'], 'key-3' in d)
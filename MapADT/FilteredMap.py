@@ -0,0 +1,86 @@
+
+from AbstractBases.Map import Map as abstractMapBase
+from MapADT.BloomFilter import ScalableBloomFilter
+from MapADT.ChainedHashTable import ChainedHashTable
+
+
+class FilteredMap(abstractMapBase):
+    """
+    Class wraps a map behind a Bloom filter holding every key ever set, so lookups of keys that
+    were never set are answered by the filter alone, without reaching the map. Worth it when most
+    lookups miss and the map is costly to probe, e.g. a large or disk backed table.
+
+    Bloom filters cannot forget a key, so deleted keys keep passing the filter and cost a lookup
+    in the map, like false positives do; rebuildFilter() starts a fresh filter from the current
+    keys once deletions have piled up.
+    """
+
+    def __init__(self, backing_map=None, bloom_filter=None):
+        """
+        Init the map
+        :param backing_map: map to wrap, a new ChainedHashTable by default. Keys it already
+                            holds are added to the filter.
+        :param bloom_filter: BloomFilter or ScalableBloomFilter, a new ScalableBloomFilter by default
+        """
+        self.__map = ChainedHashTable() if backing_map is None else backing_map
+        self.__filter = ScalableBloomFilter() if bloom_filter is None else bloom_filter
+        self.__filtered = 0
+
+        for k in self.__map:
+            self.__filter.add(k)
+
+    def __getitem__(self, k):
+        if k not in self.__filter:
+            self.__filtered += 1
+            raise KeyError("KeyError: " + repr(k))
+        return self.__map[k]
+
+    def __setitem__(self, k, value):
+        self.__filter.add(k)
+        self.__map[k] = value
+
+    def __delitem__(self, k):
+        if k not in self.__filter:
+            self.__filtered += 1
+            raise KeyError("KeyError: " + repr(k))
+        del self.__map[k]
+
+    def __contains__(self, k):
+        if k not in self.__filter:
+            self.__filtered += 1
+            return False
+        return k in self.__map
+
+    def __len__(self):
+        return len(self.__map)
+
+    def __iter__(self):
+        return iter(self.__map)
+
+    def filteredCount(self):
+        """
+        Returns the number of lookups answered by the filter without reaching the map.
+        :return: int
+        """
+        return self.__filtered
+
+    def rebuildFilter(self):
+        """
+        Replace the filter by a new one holding only the current keys.
+        """
+        self.__filter.clear()
+        for k in self.__map:
+            self.__filter.add(k)
+
+    def clear(self):
+        self.__map.clear()
+        self.__filter.clear()
+
+
+if __name__ == '__main__':
+    users = FilteredMap()
+    for n in range(5000):
+        users['user%d' % n] = n
+
+    misses = sum(1 for n in range(5000, 15000) if 'user%d' % n in users)
+    print(len(users), users['user42'], misses, users.filteredCount())
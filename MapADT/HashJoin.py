@@ -0,0 +1,161 @@
+
+import pickle
+from itertools import chain
+from tempfile import TemporaryFile
+from MapADT.MultiMap import MultiMap
+
+
+class HashJoin():
+    """
+    Class implements an in-memory hash join of two record streams. Records of the build side are
+    loaded into a MultiMap keyed by their join key; records of the probe side are then streamed
+    one at a time, each looked up in the MultiMap. join() is a generator, so the probe side is
+    consumed lazily and results are produced as it is read.
+
+    Join options:
+        INNER: 0    yield (leftRecord, rightRecord) for every matching pair.
+        LEFT: 1     same as inner, plus (leftRecord, None) for every left record without match.
+        SEMI: 2     yield every left record that has at least one match, once.
+    Left and semi joins build on the right input and probe the left one. An inner join builds on
+    the smaller input when both have a len(), and on the right one otherwise.
+
+    With a memoryBudget, the build side holds at most that many records in memory. Past it, the
+    join turns into a Grace hash join: both inputs are split into partitions by the hash value of
+    their join key, written to temporary files, and joined partition by partition. A partition
+    still over budget is split again with a different hash, up to MAX_DEPTH times. Spilled joins
+    do not yield results in probe order.
+    """
+
+    INNER = 0
+    LEFT = 1
+    SEMI = 2
+    MAX_DEPTH = 3
+
+    def __init__(self, leftKey, rightKey, joinType=0, memoryBudget=None, partitions=16):
+        """
+        Init the join
+        :param leftKey: function returning the join key of a left record
+        :param rightKey: function returning the join key of a right record
+        :param joinType: INNER=0, LEFT=1 or SEMI=2
+        :param memoryBudget: maximum number of build records held in memory, None for no limit
+        :param partitions: number of partitions the inputs are split into once over budget
+        """
+        if joinType not in (self.INNER, self.LEFT, self.SEMI):
+            raise ValueError("joinType must be one of INNER=0, LEFT=1 or SEMI=2.")
+        if memoryBudget is not None and (not isinstance(memoryBudget, int) or memoryBudget < 1):
+            raise ValueError("memoryBudget must be a positive integer.")
+        if not isinstance(partitions, int) or partitions < 2:
+            raise ValueError("partitions must be an integer of at least 2.")
+
+        self.__leftKey = leftKey
+        self.__rightKey = rightKey
+        self.__joinType = joinType
+        self.__memoryBudget = memoryBudget
+        self.__partitions = partitions
+
+    def join(self, left, right):
+        """
+        Join two iterables of records.
+        :return: Generator of tuple (leftRecord, rightRecord), or of left records for a semi join
+        """
+        if self.__joinType == self.INNER and hasattr(left, '__len__') and hasattr(right, '__len__') \
+                and len(left) < len(right):
+            return self.__join(left, right, self.__leftKey, self.__rightKey, True, 0)
+        return self.__join(right, left, self.__rightKey, self.__leftKey, False, 0)
+
+    def __join(self, build, probe, buildKey, probeKey, swapped, depth):
+        """
+        Build a MultiMap from the build records, spilling to partitions if they exceed the
+        memory budget, then probe it with the probe records.
+        :param swapped: True if the build side is the left input
+        """
+        table = MultiMap()
+        budget = self.__memoryBudget
+        build = iter(build)
+
+        for record in build:
+            table.add(buildKey(record), record)
+            if budget is not None and table.valueCount() > budget and depth < self.MAX_DEPTH:
+                buffered = (record for k, record in table.pairs())
+                yield from self.__spill(chain(buffered, build), probe, buildKey, probeKey,
+                                        swapped, depth)
+                return
+
+        yield from self.__probe(table, probe, probeKey, swapped)
+
+    def __probe(self, table, probe, probeKey, swapped):
+        joinType = self.__joinType
+
+        for record in probe:
+            k = probeKey(record)
+            if k not in table:
+                if joinType == self.LEFT:
+                    yield record, None
+                continue
+
+            if joinType == self.SEMI:
+                yield record
+            elif swapped:
+                for match in table[k]:
+                    yield match, record
+            else:
+                for match in table[k]:
+                    yield record, match
+
+    def __spill(self, build, probe, buildKey, probeKey, swapped, depth):
+        """
+        Split both sides into partitions written to temporary files, then join every pair of
+        matching partitions.
+        """
+        buildFiles = self.__partition(build, buildKey, depth)
+        probeFiles = None
+        try:
+            probeFiles = self.__partition(probe, probeKey, depth)
+            for buildFile, probeFile in zip(buildFiles, probeFiles):
+                yield from self.__join(self.__read(buildFile), self.__read(probeFile),
+                                       buildKey, probeKey, swapped, depth + 1)
+        finally:
+            for partitionFile in chain(buildFiles, probeFiles or ()):
+                partitionFile.close()
+
+    def __partition(self, records, key, depth):
+        """
+        Write every record to the partition file picked by the hash value of its key, salted
+        with depth so that a partition split again spreads over all the new partitions.
+        :return: list of files, rewound
+        """
+        files = [TemporaryFile() for i in range(self.__partitions)]
+        try:
+            for record in records:
+                pickle.dump(record, files[hash((depth, key(record))) % len(files)])
+        except BaseException:
+            for partitionFile in files:
+                partitionFile.close()
+            raise
+
+        for partitionFile in files:
+            partitionFile.seek(0)
+        return files
+
+    @staticmethod
+    def __read(partitionFile):
+        while True:
+            try:
+                yield pickle.load(partitionFile)
+            except EOFError:
+                return
+
+
+if __name__ == '__main__':
+    customers = [(1, 'ada'), (2, 'grace'), (3, 'alan'), (4, 'edsger')]
+    orders = [(100, 1, 'lamp'), (101, 3, 'desk'), (102, 1, 'chair'), (103, 9, 'sofa')]
+
+    inner = HashJoin(lambda c: c[0], lambda o: o[1], joinType=HashJoin.INNER)
+    print(sorted(inner.join(customers, orders)))
+
+    left = HashJoin(lambda c: c[0], lambda o: o[1], joinType=HashJoin.LEFT, memoryBudget=2,
+                    partitions=4)
+    print(sorted(left.join(customers, orders), key=repr))
+
+    semi = HashJoin(lambda c: c[0], lambda o: o[1], joinType=HashJoin.SEMI)
+    print(list(semi.join(customers, orders)))
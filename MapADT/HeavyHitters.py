@@ -0,0 +1,156 @@
+
+from MapADT.ChainedHashTable import ChainedHashTable
+from MapADT.CountMinSketch import CountMinSketch
+from PriorityQueueADT.Heap import Heap
+
+
+class HeavyHitters():
+    """
+    Class tracks the k most frequent keys of a stream in fixed memory. Counts are estimated by a
+    CountMinSketch, while the current top k candidates and their estimates are kept in a
+    ChainedHashTable, plus a min Heap of (estimate, serial, key) entries to find the weakest
+    candidate, which a new key must beat to take its place.
+
+    A candidate whose estimate grows gets a new heap entry rather than being moved within the
+    heap; outdated entries are skipped when they reach the top, and the heap is rebuilt from the
+    candidates once it holds more than 2k entries.
+
+    Trackers built with the same k, width, depth and seed can be merged like their sketches.
+    """
+
+    def __init__(self, k, width=2048, depth=5, seed=0):
+        """
+        Init the tracker
+        :param k: number of keys to track
+        :param width, depth, seed: see CountMinSketch
+        """
+        if not isinstance(k, int):
+            raise TypeError("k must be an integer.")
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+
+        self._k = k
+        self._sketch = CountMinSketch(width, depth, seed)
+        self._candidates = ChainedHashTable()  # key -> estimate
+        self._heap = Heap(order=0, dType=tuple)
+        self._serial = 0
+
+    def __push(self, k, estimate):
+        self._serial += 1
+        self._heap.insert((estimate, self._serial, k))
+
+        if len(self._heap) > 2 * self._k:
+            self.__rebuildHeap()
+
+    def __rebuildHeap(self):
+        """
+        Replace the heap by one holding a single, up to date entry per candidate.
+        """
+        entries = []
+        for k in self._candidates:
+            self._serial += 1
+            entries.append((self._candidates[k], self._serial, k))
+
+        self._heap = Heap(order=0, dType=tuple)
+        if entries:
+            self._heap.heapify(entries)
+
+    def __weakest(self):
+        """
+        Drop outdated entries from the top of the heap and return the up to date weakest one.
+        :return: tuple (estimate, serial, key)
+        """
+        while True:
+            entry = self._heap.peekTop()
+            estimate, serial, k = entry
+            if self._candidates.get(k) == estimate:
+                return entry
+            self._heap.removeTop()
+
+    def add(self, k, count=1):
+        """
+        Count count more occurrences of key k, making it a candidate if its estimate beats the
+        weakest candidate.
+        :return: the new estimate of k
+        """
+        estimate = self._sketch.add(k, count)
+
+        if k in self._candidates:
+            self._candidates[k] = estimate
+            self.__push(k, estimate)
+        elif len(self._candidates) < self._k:
+            self._candidates[k] = estimate
+            self.__push(k, estimate)
+        else:
+            weakestEstimate, serial, weakestKey = self.__weakest()
+            if estimate > weakestEstimate:
+                self._heap.removeTop()
+                del self._candidates[weakestKey]
+                self._candidates[k] = estimate
+                self.__push(k, estimate)
+
+        return estimate
+
+    def estimate(self, k):
+        """
+        Returns the estimated number of occurrences of key k, tracked or not.
+        :return: int
+        """
+        return self._sketch.estimate(k)
+
+    def top(self):
+        """
+        Returns the tracked keys, most frequent first.
+        :return: list of (key, estimate)
+        """
+        return sorted(self._candidates.items(), key=lambda item: item[1], reverse=True)
+
+    def __len__(self):
+        return len(self._candidates)
+
+    def sketch(self):
+        return self._sketch
+
+    def merge(self, other):
+        """
+        Add the counts of another tracker to this one. Candidates of both trackers are
+        re-estimated from the merged sketch and the k best are kept.
+        :param other: HeavyHitters of the same k, width, depth and seed
+        :return: self
+        """
+        if not isinstance(other, HeavyHitters) or self._k != other._k:
+            raise ValueError("Only trackers of the same k can be merged.")
+
+        self._sketch.merge(other._sketch)
+
+        keys = list(self._candidates)
+        for k in other._candidates:
+            if k not in self._candidates:
+                keys.append(k)
+
+        ranked = sorted(((self._sketch.estimate(k), k) for k in keys),
+                        key=lambda item: item[0], reverse=True)
+        self._candidates = ChainedHashTable()
+        for estimate, k in ranked[:self._k]:
+            self._candidates[k] = estimate
+        self.__rebuildHeap()
+        return self
+
+    def clear(self):
+        self._sketch.clear()
+        self._candidates = ChainedHashTable()
+        self._heap = Heap(order=0, dType=tuple)
+
+
+if __name__ == '__main__':
+    from random import paretovariate
+
+    workers = [HeavyHitters(5, seed=11) for worker in range(4)]
+    for n in range(40000):
+        workers[n % 4].add('/page/%d' % int(paretovariate(1.2)))
+
+    merged = workers[0]
+    for worker in workers[1:]:
+        merged.merge(worker)
+
+    print(merged.top())
@@ -0,0 +1,330 @@
+
+from array import array
+from AbstractBases.HashTable import HashTable as hashTableBase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Int64Map(hashTableBase):
+    """
+    Class implements an HashTable specialized for 64 bits signed integer keys and values.
+    Keys and values are stored unboxed in two parallel array('q') slot arrays (_table and
+    _values), 16 bytes per slot and no object per item, so at the default load factor of 0.75
+    an item costs 21 to 43 bytes depending on how recently the table grew, instead of an _Item,
+    a bucket entry and two int objects.
+
+    Collisions are resolved by linear probing. Slots are addressed by Fibonacci hashing over a
+    power of two capacity N = 2^bits: j = ((k * 2^64 / phi) mod 2^64) >> (64 - bits), which
+    spreads consecutive keys evenly and needs neither hash() nor a modulo.
+
+    Keys and values must be int objects in the 64 bits signed range; bool is rejected rather
+    than stored as 0 or 1, and so are floats, even integral ones. Two key values are reserved
+    as slot markers and cannot be used as keys:
+        EMPTY = -2^63        the slot was never used
+        TOMBSTONE = -2^63+1  the slot held a deleted item
+    Tombstones count toward the load factor like in OpenAddressHashTable.
+    Lookups of many keys at once (getMany, getArray) treat a key that can never be stored,
+    reserved or out of range, as missing and return the default for it.
+
+    getArray() and updateArrays() work on whole arrays of keys and values. When NumPy is
+    installed and the keys are given as a NumPy array, getArray() probes all keys at once
+    with vectorized array operations.
+    """
+
+    EMPTY = -2 ** 63
+    TOMBSTONE = -2 ** 63 + 1
+    MAX = 2 ** 63 - 1
+    __FIBONACCI = 11400714819323198485  # 2^64 / golden ratio, rounded to odd
+    __MASK64 = 2 ** 64 - 1
+
+    def __init__(self, load_factor=0.75, table_size=16):
+        """
+        Init the map
+        :param load_factor: maximum ratio of used slots, live or deleted, between 0 and 1
+        :param table_size: initial capacity, rounded up to a power of 2
+        """
+        if not isinstance(table_size, int):
+            raise TypeError("table_size must be an integer.")
+        self._validateOpenLoadFactor(load_factor)
+
+        table_size = 1 << max(3, (table_size - 1).bit_length())
+        super().__init__(load_factor, table_size)
+        self._initialTableSize = table_size
+        self._table = array('q', [self.EMPTY]) * table_size
+        self._values = array('q', bytes(8 * table_size))
+        self._shift = 64 - (table_size.bit_length() - 1)
+        self._tombstones = 0
+
+    def __validateKey(self, k):
+        if not isinstance(k, int) or isinstance(k, bool):
+            raise TypeError("key must be an integer.")
+        if k == self.EMPTY or k == self.TOMBSTONE:
+            raise ValueError("%d is reserved as a slot marker." % k)
+        if not self.EMPTY < k <= self.MAX:
+            raise ValueError("key %d does not fit in 64 bits." % k)
+
+    def __validateValue(self, value):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError("value must be an integer.")
+        if not self.EMPTY <= value <= self.MAX:
+            raise ValueError("value %d does not fit in 64 bits." % value)
+
+    def _compress(self, h):
+        return ((h * self.__FIBONACCI) & self.__MASK64) >> self._shift
+
+    def __findSlot(self, k):
+        """
+        Probe for key k.
+        :return: tuple (found, index). If k is absent, index is the first available slot.
+        """
+        table = self._table
+        mask = len(table) - 1
+        j = ((k * self.__FIBONACCI) & self.__MASK64) >> self._shift
+        firstAvail = None
+
+        while True:
+            key = table[j]
+            if key == k:
+                return True, j
+            if key == self.EMPTY:
+                return False, (j if firstAvail is None else firstAvail)
+            if key == self.TOMBSTONE and firstAvail is None:
+                firstAvail = j
+            j = (j + 1) & mask
+
+    def __setitem__(self, k, value):
+        self.__validateKey(k)
+        self.__validateValue(value)
+        found, j = self.__findSlot(k)
+
+        if found:
+            self._values[j] = value
+            return
+
+        self._values[j] = value
+        if self._table[j] == self.TOMBSTONE:
+            self._tombstones -= 1
+        self._table[j] = k
+        self._size += 1
+
+        capacity = len(self._table)
+        if (self._size + self._tombstones) / capacity > self._loadFactor:
+            if self._size / capacity > self._loadFactor / 2:
+                self._resize(self._grownCapacity())
+            else:
+                self._resize(capacity)
+
+    def __getitem__(self, k):
+        self.__validateKey(k)
+        found, j = self.__findSlot(k)
+
+        if not found:
+            raise KeyError("KeyError: " + repr(k))
+        return self._values[j]
+
+    def __delitem__(self, k):
+        self.__validateKey(k)
+        found, j = self.__findSlot(k)
+
+        if not found:
+            raise KeyError("KeyError: " + repr(k))
+
+        self._table[j] = self.TOMBSTONE
+        self._values[j] = 0
+        self._size -= 1
+        self._tombstones += 1
+
+    def __contains__(self, k):
+        if not isinstance(k, int) or isinstance(k, bool) or k == self.EMPTY or k == self.TOMBSTONE:
+            return False
+        return self.__findSlot(k)[0]
+
+    def __iter__(self):
+        tombstone = self.TOMBSTONE
+        for key in self._table:
+            if key > tombstone:
+                yield key
+
+    def _grownCapacity(self):
+        return len(self._table) * 2
+
+    def _capacityFor(self, n):
+        needed = 1 << (int(n / self._loadFactor) + 1).bit_length()
+        if needed > len(self._table):
+            return needed
+        return None
+
+    def _resize(self, newCapacity):
+        """
+        Rebuild the table at newCapacity slots, a power of 2, dropping every tombstone.
+        Runs in O(n) time.
+        """
+        oldTable, oldValues = self._table, self._values
+        tombstone, empty = self.TOMBSTONE, self.EMPTY
+
+        self._table = table = array('q', [empty]) * newCapacity
+        self._values = values = array('q', bytes(8 * newCapacity))
+        self._shift = shift = 64 - (newCapacity.bit_length() - 1)
+        self._tombstones = 0
+        mask = newCapacity - 1
+        fibonacci, mask64 = self.__FIBONACCI, self.__MASK64
+
+        for key, value in zip(oldTable, oldValues):
+            if key > tombstone:
+                j = ((key * fibonacci) & mask64) >> shift
+                while table[j] != empty:
+                    j = (j + 1) & mask
+                table[j] = key
+                values[j] = value
+
+    def _bulkSet(self, pairs):
+        """
+        Insert pairs into a table already sized for them, in a single tight loop.
+        Tombstones are dropped first so new keys always land in never used slots.
+        """
+        if self._tombstones:
+            self._resize(len(self._table))
+
+        table, values = self._table, self._values
+        mask = len(table) - 1
+        shift = self._shift
+        fibonacci, mask64 = self.__FIBONACCI, self.__MASK64
+        empty, tombstone, maximum = self.EMPTY, self.TOMBSTONE, self.MAX
+
+        for k, value in pairs:
+            # plain ints in range skip the full checks, which raise for anything else
+            if k.__class__ is not int or k <= tombstone or k > maximum:
+                self.__validateKey(k)
+            if value.__class__ is not int or value < empty or value > maximum:
+                self.__validateValue(value)
+
+            j = ((k * fibonacci) & mask64) >> shift
+            while True:
+                key = table[j]
+                if key == k:
+                    values[j] = value
+                    break
+                if key == empty:
+                    values[j] = value
+                    table[j] = k
+                    self._size += 1
+                    break
+                j = (j + 1) & mask
+
+    def getMany(self, keys, default=None):
+        table, values = self._table, self._values
+        mask = len(table) - 1
+        shift = self._shift
+        fibonacci, mask64 = self.__FIBONACCI, self.__MASK64
+        empty = self.EMPTY
+        result = []
+
+        for k in keys:
+            if not isinstance(k, int) or isinstance(k, bool) or k <= self.TOMBSTONE or k > self.MAX:
+                result.append(default)
+                continue
+
+            j = ((k * fibonacci) & mask64) >> shift
+            while True:
+                key = table[j]
+                if key == k:
+                    result.append(values[j])
+                    break
+                if key == empty:
+                    result.append(default)
+                    break
+                j = (j + 1) & mask
+
+        return result
+
+    def updateArrays(self, keys, values):
+        """
+        Insert keys[i] -> values[i] for every i, pre-sizing the table once.
+        :param keys: sequence of int, e.g. a list, an array('q') or a NumPy array
+        :param values: sequence of int of the same length
+        """
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length.")
+
+        if numpy is not None and isinstance(keys, numpy.ndarray):
+            keys = keys.tolist()
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = values.tolist()
+
+        self._reserve(self._size + len(keys))
+        self._bulkSet(zip(keys, values))
+
+    def getArray(self, keys, default=0):
+        """
+        Look many keys up at once.
+        :param keys: sequence of int. A NumPy array takes the vectorized path when NumPy is
+                     installed.
+        :param default: value returned for a missing key, reserved keys included
+        :return: array('q') of values in the order of keys, or a NumPy int64 array if keys is
+                 a NumPy array
+        """
+        if numpy is not None and isinstance(keys, numpy.ndarray):
+            return self.__getArrayNumpy(keys, default)
+        return array('q', self.getMany(keys, default))
+
+    def __getArrayNumpy(self, keys, default):
+        """
+        Probe every key at once: each round compares all pending keys with their current slot,
+        resolves hits and misses and moves the others on to the next slot.
+        """
+        if keys.dtype.kind not in 'iu':
+            raise TypeError("keys must be an array of integers.")
+        if keys.dtype == numpy.uint64:
+            valid = keys <= numpy.uint64(self.MAX)
+            keys = keys.astype(numpy.int64)  # the values wrapped around are not valid
+        else:
+            keys = keys.astype(numpy.int64)
+            valid = keys > self.TOMBSTONE
+
+        table = numpy.frombuffer(self._table, dtype=numpy.int64)
+        values = numpy.frombuffer(self._values, dtype=numpy.int64)
+        mask = len(table) - 1
+        result = numpy.full(len(keys), default, dtype=numpy.int64)
+
+        positions = numpy.nonzero(valid)[0]
+        keys = keys[valid]
+        slots = ((keys.astype(numpy.uint64) * numpy.uint64(self.__FIBONACCI))
+                 >> numpy.uint64(self._shift)).astype(numpy.int64)
+
+        while positions.size:
+            stored = table[slots]
+            hit = stored == keys
+            result[positions[hit]] = values[slots[hit]]
+
+            pending = ~hit & (stored != self.EMPTY)
+            positions, keys = positions[pending], keys[pending]
+            slots = (slots[pending] + 1) & mask
+
+        return result
+
+    def clear(self):
+        super().clear()
+        self._table = array('q', [self.EMPTY]) * self._initialTableSize
+        self._values = array('q', bytes(8 * self._initialTableSize))
+        self._shift = 64 - (self._initialTableSize.bit_length() - 1)
+        self._tombstones = 0
+
+
+if __name__ == '__main__':
+    d = Int64Map()
+
+    d[2 ** 40] = 1
+    d[-7] = 2
+    d[12] = 3
+    d.updateArrays(array('q', range(100, 110)), array('q', range(10)))
+    del d[12]
+
+    print(sorted(d.items()))
+    print(len(d), d.getMany([-7, 12, 105]), d.getArray([100, 101, 5], default=-1))
+
+    if numpy is not None:
+        keys = numpy.array([100, 101, 5, 2 ** 40, Int64Map.EMPTY], dtype=numpy.int64)
+        print(d.getArray(keys, default=-1), list(d.getArray(keys.tolist(), default=-1)))
@@ -0,0 +1,403 @@
+
+import mmap
+import os
+from pickle import loads
+from struct import Struct
+from AbstractBases.HashTable import HashTable as hashTableBase
+from MapADT._StableHash import StableHash
+
+
+class MmapHashTable(hashTableBase):
+    """
+    Class implements a persistent HashTable backed by two memory mapped files:
+        path: the index, a fixed size header followed by fixed width slots
+              (hash value, key offset, key length, value offset, value length).
+        path.heap: the heap, pickled keys and values appended one after the other.
+    Opening an existing table only maps both files, so it takes milliseconds whatever the
+    size of the table. Reads unpickle straight from the mapped pages and every process opening
+    the same table shares those pages through the OS page cache.
+
+    Collisions are resolved by linear probing, deleted slots are marked with a tombstone.
+    Hash values are StableHash values of the pickled keys, and the MAD parameters are stored
+    in the header, so every process finds keys at the same slots. Keys are compared by their
+    pickled bytes, in the normal form of StableHash.keyBytes(): keys equal by == such as 1, 1.0
+    and True are one key, stored and iterated over as the int 1, and tuple subclasses are stored
+    as plain tuples. Keys holding a frozenset or a set are rejected.
+
+    Updating a value appends the new one to the heap, leaving the old one behind as garbage
+    until compact() rewrites the heap. Sets and deletes write straight into the shared mappings,
+    so every process that has the table open sees them at once; flush() only forces the pages
+    and the header to disk. A reader meeting a slot that points past the end of its heap mapping,
+    appended after it mapped the heap, maps the heap again. Growing the index or compacting
+    writes new files that replace the old ones: processes that opened the table before keep the
+    older files, frozen as they were then, until they open the table again.
+    There is no locking: only one process may write, and a read racing with a write of the same
+    key may see a half written slot.
+    """
+
+    __MAGIC = b'MHT1'
+    __HEADER = Struct('<4s4xqqqqqqq')  # magic, capacity, size, tombstones, a, b, p, heapEnd
+    __SLOT = Struct('<qqqqq')  # hash, keyOffset, keyLength (0: empty, -1: tombstone), valueOffset, valueLength
+    __TOMBSTONE = -1
+    __INITIAL_HEAP = 4096
+
+    def __init__(self, path, load_factor=0.5, table_size=11, readonly=False):
+        """
+        Open the table stored at path, creating it if it does not exist.
+        :param path: path of the index file, the heap is stored at path + '.heap'
+        :param readonly: map the files read only, any change raises a PermissionError
+        """
+        self._validateOpenLoadFactor(load_factor)
+        super().__init__(load_factor, table_size, p=2 ** 61 - 1)
+        self.__path = path
+        self.__heapPath = path + '.heap'
+        self.__readonly = readonly
+        self.__indexFile = self.__heapFile = None
+        self.__index = self.__heap = None
+
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError("No table at %s." % path)
+            self.__writeIndex(table_size, bytearray(table_size * self.__SLOT.size), 0)
+            with open(self.__heapPath, 'wb') as heapFile:
+                heapFile.truncate(self.__INITIAL_HEAP)
+            self._size = self._tombstones = 0
+
+        self.__mapIndex()
+        self.__mapHeap()
+
+    def __mapIndex(self):
+        mode, access = ('rb', mmap.ACCESS_READ) if self.__readonly else ('r+b', mmap.ACCESS_WRITE)
+        self.__indexFile = open(self.__path, mode)
+        self.__index = mmap.mmap(self.__indexFile.fileno(), 0, access=access)
+
+        magic, capacity, size, tombstones, a, b, p, heapEnd = self.__HEADER.unpack_from(self.__index, 0)
+        if magic != self.__MAGIC:
+            raise ValueError("%s is not a MmapHashTable index." % self.__path)
+
+        self._capacity, self._size, self._tombstones = capacity, size, tombstones
+        self._a, self._b, self._p, self._heapEnd = a, b, p, heapEnd
+
+    def __mapHeap(self):
+        mode, access = ('rb', mmap.ACCESS_READ) if self.__readonly else ('r+b', mmap.ACCESS_WRITE)
+        self.__heapFile = open(self.__heapPath, mode)
+        self.__heap = mmap.mmap(self.__heapFile.fileno(), 0, access=access)
+
+    def __remapHeap(self):
+        """
+        Map the heap file opened by __mapHeap() again, at its current length. The file itself is
+        not reopened: after a compact() by another process the path names a new heap, which the
+        index of this process does not describe.
+        """
+        access = mmap.ACCESS_READ if self.__readonly else mmap.ACCESS_WRITE
+        self.__heap.close()
+        self.__heap = mmap.mmap(self.__heapFile.fileno(), 0, access=access)
+
+    def __checkHeapEnd(self, end):
+        """
+        Make sure the heap mapping reaches end, mapping the heap again if another process has
+        appended to it since.
+        :exception raise a ValueError if the heap file itself is shorter
+        """
+        if end > len(self.__heap):
+            self.__remapHeap()
+            if end > len(self.__heap):
+                raise ValueError("The index of %s points past the end of its heap." % self.__path)
+
+    def __unmap(self):
+        for resource in (self.__index, self.__indexFile, self.__heap, self.__heapFile):
+            if resource is not None:
+                resource.close()
+        self.__index = self.__indexFile = self.__heap = self.__heapFile = None
+
+    def __writeIndex(self, capacity, slots, heapEnd):
+        """
+        Write a whole index file next to the current one, then swap it in.
+        """
+        temporaryPath = self.__path + '.tmp'
+        with open(temporaryPath, 'wb') as indexFile:
+            indexFile.write(self.__HEADER.pack(self.__MAGIC, capacity, self._size, 0,
+                                               self._a, self._b, self._p, heapEnd))
+            indexFile.write(slots)
+        os.replace(temporaryPath, self.__path)
+
+    def __writeHeader(self):
+        self.__HEADER.pack_into(self.__index, 0, self.__MAGIC, self._capacity, self._size,
+                                self._tombstones, self._a, self._b, self._p, self._heapEnd)
+
+    def __checkWritable(self):
+        if self.__readonly:
+            raise PermissionError("The table is opened read only.")
+        if self.__index is None:
+            raise ValueError("The table is closed.")
+
+    def __slotOffset(self, j):
+        return self.__HEADER.size + j * self.__SLOT.size
+
+    def __findSlot(self, keyBytes, h):
+        """
+        Probe for a key given its pickled bytes and hash value.
+        :return: tuple (found, slot). If the key is absent, slot is the first available slot.
+        """
+        while True:
+            found, j, end = self.__probe(keyBytes, h)
+            if end is None:
+                return found, j
+            self.__checkHeapEnd(end)
+
+    def __probe(self, keyBytes, h):
+        """
+        Probe for a key given its pickled bytes and hash value.
+        :return: tuple (found, slot, None), or (False, None, end) if a candidate key ends at end,
+                 past the heap mapping
+        """
+        index = self.__index
+        slotStruct = self.__SLOT
+        capacity = self._capacity
+        j = self._compress(h)
+        firstAvail = None
+
+        with memoryview(self.__heap) as heap:
+            while True:
+                slotHash, keyOffset, keyLength, valueOffset, valueLength = \
+                    slotStruct.unpack_from(index, self.__slotOffset(j))
+
+                if keyLength == 0:
+                    return False, (j if firstAvail is None else firstAvail), None
+
+                if keyLength == self.__TOMBSTONE:
+                    if firstAvail is None:
+                        firstAvail = j
+                elif slotHash == h and keyLength == len(keyBytes):
+                    if keyOffset + keyLength > len(heap):
+                        return False, None, keyOffset + keyLength
+                    if heap[keyOffset:keyOffset + keyLength] == keyBytes:
+                        return True, j, None
+
+                j += 1
+                if j == capacity:
+                    j = 0
+
+    def __readSlot(self, j):
+        return self.__SLOT.unpack_from(self.__index, self.__slotOffset(j))
+
+    def __load(self, offset, length):
+        """
+        Unpickle an object straight from the mapped heap.
+        """
+        self.__checkHeapEnd(offset + length)
+        with memoryview(self.__heap) as heap:
+            with heap[offset:offset + length] as data:
+                return loads(data)
+
+    def __append(self, data):
+        """
+        Append data to the heap, growing the heap file when needed.
+        :return: offset of the data in the heap
+        """
+        offset = self._heapEnd
+        end = offset + len(data)
+
+        if end > len(self.__heap):
+            newLength = max(end, 2 * len(self.__heap))
+            self.__heap.close()
+            self.__heapFile.truncate(newLength)
+            self.__heap = mmap.mmap(self.__heapFile.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+        self.__heap[offset:end] = data
+        self._heapEnd = end
+        return offset
+
+    def _compress(self, h):
+        return (h * self._a + self._b) % self._p % self._capacity
+
+    def __setitem__(self, k, value):
+        self.__checkWritable()
+        keyBytes = StableHash.keyBytes(k)
+        valueBytes = StableHash.valueBytes(value)
+        h = StableHash.ofBytes(keyBytes)
+        found, j = self.__findSlot(keyBytes, h)
+
+        if found:
+            slotHash, keyOffset, keyLength, valueOffset, valueLength = self.__readSlot(j)
+        else:
+            if self.__readSlot(j)[2] == self.__TOMBSTONE:
+                self._tombstones -= 1
+            keyOffset, keyLength = self.__append(keyBytes), len(keyBytes)
+            self._size += 1
+
+        valueOffset = self.__append(valueBytes)
+        self.__SLOT.pack_into(self.__index, self.__slotOffset(j), h, keyOffset, keyLength,
+                              valueOffset, len(valueBytes))
+
+        if (self._size + self._tombstones) / self._capacity > self._loadFactor:
+            if self._size / self._capacity > self._loadFactor / 2:
+                self._resize(self._grownCapacity())
+            else:
+                self._resize(self._capacity)
+        else:
+            self.__writeHeader()
+
+    def __getitem__(self, k):
+        keyBytes = StableHash.keyBytes(k)
+        found, j = self.__findSlot(keyBytes, StableHash.ofBytes(keyBytes))
+
+        if not found:
+            raise KeyError("KeyError: " + repr(k))
+
+        slotHash, keyOffset, keyLength, valueOffset, valueLength = self.__readSlot(j)
+        return self.__load(valueOffset, valueLength)
+
+    def __delitem__(self, k):
+        self.__checkWritable()
+        keyBytes = StableHash.keyBytes(k)
+        found, j = self.__findSlot(keyBytes, StableHash.ofBytes(keyBytes))
+
+        if not found:
+            raise KeyError("KeyError: " + repr(k))
+
+        self.__SLOT.pack_into(self.__index, self.__slotOffset(j), 0, 0, self.__TOMBSTONE, 0, 0)
+        self._size -= 1
+        self._tombstones += 1
+        self.__writeHeader()
+
+    def __contains__(self, k):
+        keyBytes = StableHash.keyBytes(k)
+        return self.__findSlot(keyBytes, StableHash.ofBytes(keyBytes))[0]
+
+    def __iter__(self):
+        for j in range(self._capacity):
+            slotHash, keyOffset, keyLength, valueOffset, valueLength = self.__readSlot(j)
+            if keyLength > 0:
+                yield self.__load(keyOffset, keyLength)
+
+    def __len__(self):
+        if self.__readonly and self.__index is not None:
+            # the writer keeps the size in the shared header up to date
+            return self.__HEADER.unpack_from(self.__index, 0)[2]
+        return self._size
+
+    def capacity(self):
+        return self._capacity
+
+    def _grownCapacity(self):
+        if self._capacity < 50000:
+            return self._capacity * 3
+        return self._capacity * 2
+
+    def _capacityFor(self, n):
+        needed = int(n / self._loadFactor) + 1
+        if needed > self._capacity:
+            return needed
+        return None
+
+    def _resize(self, newCapacity):
+        """
+        Rebuild the index at newCapacity slots, dropping every tombstone. The heap is left as is.
+        """
+        self.__checkWritable()
+        self.__rebuild(newCapacity, False)
+
+    def __rebuild(self, newCapacity, compactHeap):
+        """
+        Write a new index of newCapacity slots, and a new heap holding only the live keys and
+        values if compactHeap is True, then map them in place of the current files.
+        """
+        slotStruct = self.__SLOT
+        slots = bytearray(newCapacity * slotStruct.size)
+        oldCapacity = self._capacity
+        self._capacity = newCapacity
+
+        if compactHeap:
+            temporaryHeapPath = self.__heapPath + '.tmp'
+            newHeap = open(temporaryHeapPath, 'wb')
+        heapEnd = 0
+
+        with memoryview(self.__heap) as heap:
+            for cursor in range(oldCapacity):
+                h, keyOffset, keyLength, valueOffset, valueLength = self.__readSlot(cursor)
+                if keyLength <= 0:
+                    continue
+
+                if compactHeap:
+                    newHeap.write(heap[keyOffset:keyOffset + keyLength])
+                    newHeap.write(heap[valueOffset:valueOffset + valueLength])
+                    keyOffset, valueOffset = heapEnd, heapEnd + keyLength
+                    heapEnd += keyLength + valueLength
+
+                j = self._compress(h)
+                while slotStruct.unpack_from(slots, j * slotStruct.size)[2] != 0:
+                    j += 1
+                    if j == newCapacity:
+                        j = 0
+                slotStruct.pack_into(slots, j * slotStruct.size, h, keyOffset, keyLength,
+                                     valueOffset, valueLength)
+
+        if compactHeap:
+            newHeap.truncate(max(heapEnd, self.__INITIAL_HEAP))
+            newHeap.close()
+        else:
+            heapEnd = self._heapEnd
+
+        self.__unmap()
+        if compactHeap:
+            os.replace(temporaryHeapPath, self.__heapPath)
+        self.__writeIndex(newCapacity, slots, heapEnd)
+        self.__mapIndex()
+        self.__mapHeap()
+
+    def flush(self):
+        """
+        Write every change made so far to the files.
+        """
+        if self.__readonly or self.__index is None:
+            return
+        self.__writeHeader()
+        self.__index.flush()
+        self.__heap.flush()
+
+    def compact(self):
+        """
+        Rewrite the heap keeping only the live keys and values, and rebuild the index without
+        tombstones at the capacity fitting the current number of items. Runs in O(n) time.
+        """
+        self.__checkWritable()
+        self.flush()
+        self.__rebuild(max(self._initialTableSize, int(self._size / self._loadFactor) + 1), True)
+
+    def close(self):
+        """
+        Flush and unmap the table. It can no longer be used afterwards.
+        """
+        self.flush()
+        self.__unmap()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def clear(self):
+        self.__checkWritable()
+        self._size = self._tombstones = self._capacity = 0
+        self.__rebuild(self._initialTableSize, True)
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'languages.table')
+
+    with MmapHashTable(path) as d:
+        d['microsoft'] = 'c#'
+        d['oracle'] = 'java'
+        d['google'] = 'go'
+        d['apple'] = 'swift'
+        d['google'] = ['go', 'dart']
+        del d['oracle']
+
+    with MmapHashTable(path, readonly=True) as d:
+        for j in d.items():
+            print(j)
+        print(len(d))
@@ -0,0 +1,113 @@
+
+from AbstractBases.Map import Map as abstractMapBase
+from MapADT.ChainedHashTable import ChainedHashTable
+
+
+class MultiMap(abstractMapBase):
+    """
+    Class implements a map from a key to many values. Values of a key are kept together as one
+    run, a plain list stored under the key in a ChainedHashTable, so the table holds a single
+    _Item per key rather than one per (key, value) pair, and all the values of a key are found
+    with a single lookup.
+
+    As a Map, m[k] is the tuple of the values of k in insertion order, m[k] = values replaces
+    them and del m[k] removes them all; len() counts the keys. add() and remove() work on a
+    single value, valueCount() counts the (key, value) pairs.
+    """
+
+    def __init__(self):
+        self.__runs = ChainedHashTable()
+        self.__valueCount = 0
+
+    def add(self, k, value):
+        """
+        Add value to the values of key k.
+        """
+        try:
+            self.__runs[k].append(value)
+        except KeyError:
+            self.__runs[k] = [value]
+        self.__valueCount += 1
+
+    def remove(self, k, value):
+        """
+        Remove the first occurrence of value from the values of key k, and k itself once it has
+        no value left.
+        :exception raise a KeyError if k is not in the map, a ValueError if value is not one
+                   of its values
+        """
+        run = self.__runs[k]
+        run.remove(value)
+        self.__valueCount -= 1
+        if not run:
+            del self.__runs[k]
+
+    def __getitem__(self, k):
+        return tuple(self.__runs[k])
+
+    def __setitem__(self, k, values):
+        values = list(values)
+        if k in self.__runs:
+            self.__valueCount -= len(self.__runs[k])
+
+        if values:
+            self.__runs[k] = values
+            self.__valueCount += len(values)
+        elif k in self.__runs:
+            del self.__runs[k]
+
+    def __delitem__(self, k):
+        self.__valueCount -= len(self.__runs[k])
+        del self.__runs[k]
+
+    def __contains__(self, k):
+        return k in self.__runs
+
+    def count(self, k):
+        """
+        Returns the number of values of key k, 0 if k is not in the map.
+        :return: int
+        """
+        try:
+            return len(self.__runs[k])
+        except KeyError:
+            return 0
+
+    def __len__(self):
+        return len(self.__runs)
+
+    def valueCount(self):
+        """
+        Returns the number of (key, value) pairs.
+        :return: int
+        """
+        return self.__valueCount
+
+    def __iter__(self):
+        return iter(self.__runs)
+
+    def pairs(self):
+        """
+        Yield every (key, value) pair, the values of a key in insertion order.
+        :return: Generator of tuple (key, value)
+        """
+        for k in self.__runs:
+            for value in self.__runs[k]:
+                yield k, value
+
+    def clear(self):
+        self.__runs.clear()
+        self.__valueCount = 0
+
+
+if __name__ == '__main__':
+    authors = MultiMap()
+
+    authors.add('knuth', 'taocp vol 1')
+    authors.add('knuth', 'taocp vol 2')
+    authors.add('sedgewick', 'algorithms')
+    authors.add('knuth', 'concrete mathematics')
+    authors.remove('knuth', 'taocp vol 2')
+
+    print(authors['knuth'], authors.count('sedgewick'), len(authors), authors.valueCount())
+    print(sorted(authors.pairs()))
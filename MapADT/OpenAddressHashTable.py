@@ -0,0 +1,231 @@
+
+from AbstractBases.HashTable import HashTable as hashTableBase
+
+
+class OpenAddressHashTable(hashTableBase):
+    """
+    Class implements an HashTable via open addressing.
+    Keys, values and their cached hash values are stored in three flat parallel
+    arrays (_table, _values and _hashes), so a lookup never touches a per-bucket object
+    and equality is only checked when the cached hash values match.
+
+    Collisions are resolved by probing. Probing options:
+        linear: 0    j = (h + i) mod N
+        quadratic: 1    j = (h + i*i) mod N
+    The table capacity is always kept prime, which together with a load factor not
+    above 0.5 guarantees that quadratic probing finds an available slot.
+
+    Deleted slots are marked with a tombstone so probe sequences passing through them
+    are not broken. Tombstones count toward the load factor; once live items plus
+    tombstones exceed it, the table is rebuilt, growing only if the live items alone
+    occupy more than half of the allowed load.
+    """
+
+    __AVAIL = object()  # tombstone marker for a deleted slot
+    _countsProbes = True
+
+    def __init__(self, load_factor=0.5, table_size=11, p=137, probing=0):
+        if not isinstance(probing, int):
+            raise TypeError("probing must be an integer.")
+
+        super().__init__(load_factor, self._nextPrime(table_size), p)
+        self._initialTableSize = len(self._table)
+        self.__isQuadratic = probing == 1
+        self._values = [None] * len(self._table)
+        self._hashes = [None] * len(self._table)
+        self._tombstones = 0
+
+    def __findSlot(self, k, h):
+        """
+        Probe for key k with hash value h.
+        :return: tuple (found, index, probes). If k is absent, index is the first available
+                 slot along the probe sequence, or None if the probe sequence is exhausted.
+                 probes is the number of slots examined.
+        """
+        table = self._table
+        hashes = self._hashes
+        capacity = len(table)
+        home = j = self._compress(h)
+        firstAvail = None
+        avail = self.__AVAIL
+
+        for i in range(1, capacity + 1):
+            slotHash = hashes[j]
+            if slotHash is None:
+                return False, (j if firstAvail is None else firstAvail), i
+
+            key = table[j]
+            if key is avail:
+                if firstAvail is None:
+                    firstAvail = j
+            elif slotHash == h and (key is k or key == k):
+                return True, j, i
+
+            if self.__isQuadratic:
+                j = (home + i * i) % capacity
+            else:
+                j += 1
+                if j == capacity:
+                    j = 0
+
+        return False, firstAvail, capacity
+
+    def __setitem__(self, k, value):
+        h = hash(k)
+        found, j, probes = self.__findSlot(k, h)
+
+        while j is None:
+            # the probe sequence is exhausted, k is absent: probe again in a larger table
+            self._resize(self._grownCapacity())
+            found, j, probes = self.__findSlot(k, h)
+
+        if self._stats is not None:
+            self._recordProbes('set', probes)
+
+        if found:
+            self._values[j] = value
+            return
+
+        if self._table[j] is self.__AVAIL:
+            self._tombstones -= 1
+
+        self._table[j] = k
+        self._values[j] = value
+        self._hashes[j] = h
+        self._size += 1
+
+        capacity = len(self._table)
+        if (self._size + self._tombstones) / capacity > self._loadFactor:
+            if self._size / capacity > self._loadFactor / 2:
+                self._resize(self._grownCapacity())
+            else:
+                self._resize(capacity)
+
+    def __getitem__(self, k):
+        found, j, probes = self.__findSlot(k, hash(k))
+
+        if self._stats is not None:
+            self._recordProbes('get', probes)
+
+        if not found:
+            raise KeyError("KeyError: " + repr(k))
+        return self._values[j]
+
+    def __delitem__(self, k):
+        found, j, probes = self.__findSlot(k, hash(k))
+
+        if not found:
+            raise KeyError("KeyError: " + repr(k))
+
+        self._table[j] = self.__AVAIL
+        self._values[j] = None
+        self._size -= 1
+        self._tombstones += 1
+
+    def __contains__(self, k):
+        return self.__findSlot(k, hash(k))[0]
+
+    def __iter__(self):
+        avail = self.__AVAIL
+        for key, h in zip(self._table, self._hashes):
+            if h is not None and key is not avail:
+                yield key
+
+    def __probeLength(self, k, h):
+        """
+        Returns the number of slots a lookup of key k with hash value h examines, live slots
+        only counting as a match.
+        """
+        table = self._table
+        hashes = self._hashes
+        capacity = len(table)
+        home = j = self._compress(h)
+        avail = self.__AVAIL
+
+        for i in range(1, capacity + 1):
+            slotHash = hashes[j]
+            if slotHash is None:
+                return i
+
+            key = table[j]
+            if key is not avail and slotHash == h and (key is k or key == k):
+                return i
+
+            if self.__isQuadratic:
+                j = (home + i * i) % capacity
+            else:
+                j += 1
+                if j == capacity:
+                    j = 0
+
+        return capacity
+
+    def _chainLengths(self):
+        avail = self.__AVAIL
+        for key, h in zip(self._table, self._hashes):
+            if h is None or key is avail:
+                yield 0
+            else:
+                yield self.__probeLength(key, h)
+
+    def _resize(self, newCapacity):
+        """
+        Rebuild the table at a prime capacity not below newCapacity, dropping every tombstone.
+        Runs in O(n) time; cached hash values are reused, so hash() is never called again
+        and no equality check is needed since all re-inserted keys are distinct.
+        """
+        oldTable, oldValues, oldHashes = self._table, self._values, self._hashes
+        avail = self.__AVAIL
+
+        newCapacity = self._nextPrime(newCapacity)
+        self._adjustPrime(newCapacity)
+        self._table = table = [None] * newCapacity
+        self._values = values = [None] * newCapacity
+        self._hashes = hashes = [None] * newCapacity
+        self._tombstones = 0
+
+        for cursor in range(len(oldTable)):
+            h = oldHashes[cursor]
+            if h is None or oldTable[cursor] is avail:
+                continue
+
+            home = j = self._compress(h)
+            i = 0
+            while hashes[j] is not None:
+                i += 1
+                if self.__isQuadratic:
+                    j = (home + i * i) % newCapacity
+                else:
+                    j += 1
+                    if j == newCapacity:
+                        j = 0
+
+            table[j] = oldTable[cursor]
+            values[j] = oldValues[cursor]
+            hashes[j] = h
+
+    def clear(self):
+        super().clear()
+        self._values = [None] * self._initialTableSize
+        self._hashes = [None] * self._initialTableSize
+        self._tombstones = 0
+
+
+if __name__ == '__main__':
+    d = OpenAddressHashTable(probing=1)
+
+    d['microsoft'] = 'c#'
+    d['oracle'] = 'java'
+    d['google'] = 'go'
+    d['apple'] = 'swift'
+    d['yahoo'] = 'YUI'
+    d['mozilla'] = 'javascript'
+    d['google2'] = 'angularJS'
+    d['square'] = 'picasso'
+
+    del d['yahoo']
+
+    for j in d.items():
+        print(j)
+
+    print(len(d))
@@ -0,0 +1,319 @@
+
+from multiprocessing import Pipe, Process
+from AbstractBases.Map import Map as abstractMapBase
+from MapADT.ChainedHashTable import ChainedHashTable
+from MapADT.ConsistentHashRing import ConsistentHashRing
+
+
+class PartitionedMap(abstractMapBase):
+    """
+    Class implements a map partitioned across worker processes. Every worker holds its partition
+    in a ChainedHashTable and serves requests sent over a Pipe; a ConsistentHashRing routes every
+    key to its worker, so adding or removing a worker only moves the keys the ring reassigns,
+    about 1/N of them, instead of nearly all of them as with hash(k) mod N.
+
+    Every single key operation is a round trip to a worker process: updateMany() and getMany()
+    send one message per worker for a whole batch of keys instead. Keys and values must be
+    picklable. Keys routed alike by StableHash.of(), such as 1, 1.0 and True, end up in the same
+    partition and are then one key like in a dict. A PartitionedMap must not be shared between
+    threads.
+    """
+
+    def __init__(self, workers=4, replicas=100):
+        """
+        Init the map and start its workers
+        :param workers: number of worker processes
+        :param replicas: see ConsistentHashRing
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer.")
+
+        self.__ring = ConsistentHashRing(replicas)
+        self.__connections = {}  # worker id -> connection
+        self.__processes = {}  # worker id -> Process
+        self.__nextId = 0
+
+        for i in range(workers):
+            self.__ring.addNode(self.__startWorker())
+
+    @staticmethod
+    def _serve(connection):
+        """
+        Worker loop: apply every (operation, arguments) request received to the partition and
+        send back ('ok', result) or ('error', exception), until asked to stop.
+        """
+        table = ChainedHashTable()
+
+        while True:
+            operation, arguments = connection.recv()
+            try:
+                if operation == 'set':
+                    k, value = arguments
+                    table[k] = value
+                    result = None
+                elif operation == 'get':
+                    result = table[arguments]
+                elif operation == 'delete':
+                    del table[arguments]
+                    result = None
+                elif operation == 'contains':
+                    result = arguments in table
+                elif operation == 'len':
+                    result = len(table)
+                elif operation == 'keys':
+                    result = list(table)
+                elif operation == 'updateMany':
+                    table.updateMany(arguments)
+                    result = None
+                elif operation == 'getMany':
+                    keys, default = arguments
+                    result = table.getMany(keys, default)
+                elif operation == 'misplaced':
+                    # the items the ring assigns to another worker, all of them if ring is None
+                    ring, workerId = arguments
+                    result = [(k, value) for k, value in table.items()
+                              if ring is None or ring.nodeFor(k) != workerId]
+                elif operation == 'adopt':
+                    # items moved from another worker: a key already here was written since the
+                    # ring changed, so it is newer and kept
+                    for k, value in arguments:
+                        if k not in table:
+                            table[k] = value
+                    result = None
+                elif operation == 'deleteMany':
+                    for k in arguments:
+                        table.pop(k, None)
+                    result = None
+                elif operation == 'clear':
+                    table.clear()
+                    result = None
+                elif operation == 'stop':
+                    connection.send(('ok', None))
+                    connection.close()
+                    return
+                else:
+                    raise ValueError("Unknown operation %r." % operation)
+            except Exception as exception:
+                connection.send(('error', exception))
+            else:
+                connection.send(('ok', result))
+
+    def __startWorker(self):
+        workerId = self.__nextId
+        self.__nextId += 1
+
+        connection, workerConnection = Pipe()
+        process = Process(target=PartitionedMap._serve, args=(workerConnection,), daemon=True)
+        process.start()
+        workerConnection.close()
+
+        self.__connections[workerId] = connection
+        self.__processes[workerId] = process
+        return workerId
+
+    def __call(self, workerId, operation, arguments=None):
+        connection = self.__connections[workerId]
+        connection.send((operation, arguments))
+        status, result = connection.recv()
+        if status == 'error':
+            raise result
+        return result
+
+    def __broadcast(self, operation, arguments=None):
+        """
+        Send the same request to every worker at once, then collect the results.
+        :return: dict worker id -> result
+        """
+        for connection in self.__connections.values():
+            connection.send((operation, arguments))
+
+        results = {}
+        error = None
+        for workerId, connection in self.__connections.items():
+            status, result = connection.recv()
+            if status == 'error':
+                error = result
+            results[workerId] = result
+
+        if error is not None:
+            raise error
+        return results
+
+    def __setitem__(self, k, value):
+        self.__call(self.__ring.nodeFor(k), 'set', (k, value))
+
+    def __getitem__(self, k):
+        return self.__call(self.__ring.nodeFor(k), 'get', k)
+
+    def __delitem__(self, k):
+        self.__call(self.__ring.nodeFor(k), 'delete', k)
+
+    def __contains__(self, k):
+        return self.__call(self.__ring.nodeFor(k), 'contains', k)
+
+    def __len__(self):
+        return sum(self.__broadcast('len').values())
+
+    def __iter__(self):
+        for keys in self.__broadcast('keys').values():
+            for k in keys:
+                yield k
+
+    def updateMany(self, pairs):
+        """
+        Insert many items at once, with one request per worker.
+        :param pairs: a Mapping or an iterable of (key, value) pairs
+        """
+        if hasattr(pairs, 'items'):
+            pairs = pairs.items()
+        self.__scatter('updateMany', pairs)
+
+    def __scatter(self, operation, pairs):
+        """
+        Send every worker a request with the batch of pairs the ring assigns to it, then wait
+        for all of them to answer.
+        :exception raise an error a worker answered with, once all of them answered
+        """
+        batches = {}
+        for k, value in pairs:
+            batches.setdefault(self.__ring.nodeFor(k), []).append((k, value))
+
+        for workerId, batch in batches.items():
+            self.__connections[workerId].send((operation, batch))
+        error = None
+        for workerId in batches:
+            status, result = self.__connections[workerId].recv()
+            if status == 'error':
+                error = result
+
+        if error is not None:
+            raise error
+
+    def getMany(self, keys, default=None):
+        """
+        Look many keys up at once, with one request per worker.
+        :return: list of values in the order of keys
+        """
+        keys = list(keys)
+        batches = {}
+        for position, k in enumerate(keys):
+            batch, positions = batches.setdefault(self.__ring.nodeFor(k), ([], []))
+            batch.append(k)
+            positions.append(position)
+
+        for workerId, (batch, positions) in batches.items():
+            self.__connections[workerId].send(('getMany', (batch, default)))
+
+        values = [default] * len(keys)
+        error = None
+        for workerId, (batch, positions) in batches.items():
+            status, result = self.__connections[workerId].recv()
+            if status == 'error':
+                error = result
+                continue
+            for position, value in zip(positions, result):
+                values[position] = value
+
+        if error is not None:
+            raise error
+        return values
+
+    def addWorker(self, weight=1):
+        """
+        Start a new worker and move to it the keys the ring now assigns to it.
+        :param weight: relative share of the keys the worker should own
+        :return: id of the new worker
+        """
+        workerId = self.__startWorker()
+        self.__ring.addNode(workerId, weight)
+        self.__rebalance()
+        return workerId
+
+    def removeWorker(self, workerId):
+        """
+        Hand the keys of a worker over to the others, then stop it.
+        :exception raise a KeyError if there is no such worker, a ValueError if it is the last one
+        """
+        if workerId not in self.__connections:
+            raise KeyError("KeyError: " + repr(workerId))
+        if len(self.__connections) == 1:
+            raise ValueError("The last worker cannot be removed.")
+
+        # the worker keeps its items until the others have accepted a copy of them
+        items = self.__call(workerId, 'misplaced', (None, workerId))
+        weight = self.__ring.weight(workerId)
+        self.__ring.removeNode(workerId)
+        try:
+            self.__scatter('adopt', items)
+        except Exception:
+            self.__ring.addNode(workerId, weight)
+            raise
+        self.__stopWorker(workerId)
+
+    def __rebalance(self):
+        """
+        Move every key to the worker the ring assigns it to. Items are copied to their new
+        worker first and only deleted from their old one once every copy was accepted, so a
+        failing worker leaves items in two places at worst, never in none; the next rebalance
+        then deletes the old copies without overwriting the new ones.
+        """
+        misplaced = {}
+        for workerId in list(self.__connections):
+            misplaced[workerId] = self.__call(workerId, 'misplaced', (self.__ring, workerId))
+
+        self.__scatter('adopt', [item for items in misplaced.values() for item in items])
+
+        for workerId, items in misplaced.items():
+            if items:
+                self.__call(workerId, 'deleteMany', [k for k, value in items])
+
+    def setWeight(self, workerId, weight):
+        """
+        Change the share of the keys a worker owns and move the keys accordingly.
+        """
+        if workerId not in self.__connections:
+            raise KeyError("KeyError: " + repr(workerId))
+        self.__ring.addNode(workerId, weight)
+        self.__rebalance()
+
+    def workers(self):
+        return list(self.__connections)
+
+    def workerFor(self, k):
+        """
+        Returns the id of the worker key k belongs to.
+        """
+        return self.__ring.nodeFor(k)
+
+    def clear(self):
+        self.__broadcast('clear')
+
+    def __stopWorker(self, workerId):
+        self.__call(workerId, 'stop')
+        self.__connections.pop(workerId).close()
+        self.__processes.pop(workerId).join()
+
+    def close(self):
+        """
+        Stop every worker. The map can no longer be used afterwards.
+        """
+        for workerId in list(self.__connections):
+            self.__stopWorker(workerId)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+if __name__ == '__main__':
+    with PartitionedMap(workers=3) as m:
+        m.updateMany(('user:%d' % n, n) for n in range(3000))
+        m['admin'] = -1
+
+        before = {k: m.workerFor(k) for k in m}
+        m.addWorker()
+        moved = sum(1 for k in before if m.workerFor(k) != before[k])
+
+        print(len(m), m['user:42'], m.getMany(['admin', 'nobody']), moved / len(before))
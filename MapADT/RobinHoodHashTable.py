@@ -0,0 +1,204 @@
+
+from AbstractBases.HashTable import HashTable as hashTableBase
+
+
+class RobinHoodHashTable(hashTableBase):
+    """
+    Class implements an HashTable via Robin Hood hashing, a linear probing scheme in which
+    an item being inserted takes the slot of any item closer to its home slot than itself,
+    and that item carries on probing instead. Every item thus stays about as far from its home
+    slot as every other one, keeping probe lengths low and predictable even at load factors of
+    0.85 - 0.9, hence the default load factor of 0.85.
+
+    Keys, values, cached hash values and the distance of every item from its home slot are stored
+    in flat parallel arrays. A lookup stops as soon as it meets an item closer to its home slot
+    than the key in question would be, so misses are as short as hits.
+    Deletion shifts the following items of the cluster one slot back, so no tombstone is ever left.
+    """
+
+    _countsProbes = True
+
+    def __init__(self, load_factor=0.85, table_size=11, p=137):
+        self._validateOpenLoadFactor(load_factor)
+        super().__init__(load_factor, table_size, p)
+        self._values = [None] * table_size
+        self._hashes = [None] * table_size
+        self._distances = [0] * table_size
+        self._totalDistance = 0
+
+    def __find(self, k, h):
+        """
+        Probe for key k with hash value h.
+        :return: tuple (slot, probes), slot being -1 if k is absent and probes the number of
+                 slots examined
+        """
+        table = self._table
+        hashes = self._hashes
+        distances = self._distances
+        capacity = len(table)
+        j = self._compress(h)
+        distance = 0
+
+        while hashes[j] is not None and distances[j] >= distance:
+            if hashes[j] == h:
+                key = table[j]
+                if key is k or key == k:
+                    return j, distance + 1
+            j += 1
+            if j == capacity:
+                j = 0
+            distance += 1
+
+        return -1, distance + 1
+
+    def __place(self, k, value, h, searching):
+        """
+        Insert an item Robin Hood style.
+        :param searching: True if k might already be in the table, in which case its value is replaced
+                          and, while stats are enabled, the slots examined to find out are recorded
+                          as a set.
+        :return: True if a new item was added
+        """
+        table = self._table
+        values = self._values
+        hashes = self._hashes
+        distances = self._distances
+        capacity = len(table)
+        j = self._compress(h)
+        distance = 0
+
+        while True:
+            slotHash = hashes[j]
+            if slotHash is None:
+                if searching and self._stats is not None:
+                    self._recordProbes('set', distance + 1)
+                table[j], values[j], hashes[j], distances[j] = k, value, h, distance
+                self._totalDistance += distance
+                return True
+
+            if searching and slotHash == h and (table[j] is k or table[j] == k):
+                if self._stats is not None:
+                    self._recordProbes('set', distance + 1)
+                values[j] = value
+                return False
+
+            if distances[j] < distance:
+                if searching and self._stats is not None:
+                    self._recordProbes('set', distance + 1)
+                # the resident is richer, it gives up its slot and the search is over since k
+                # would have been met before any item closer to its home slot
+                self._totalDistance += distance - distances[j]
+                k, table[j] = table[j], k
+                value, values[j] = values[j], value
+                h, hashes[j] = slotHash, h
+                distance, distances[j] = distances[j], distance
+                searching = False
+
+            j += 1
+            if j == capacity:
+                j = 0
+            distance += 1
+
+    def __setitem__(self, k, value):
+        if self.__place(k, value, hash(k), True):
+            self._size += 1
+
+            if self._size / len(self._table) > self._loadFactor:
+                self._resize(self._grownCapacity())
+
+    def __getitem__(self, k):
+        j, probes = self.__find(k, hash(k))
+
+        if self._stats is not None:
+            self._recordProbes('get', probes)
+
+        if j < 0:
+            raise KeyError("KeyError: " + repr(k))
+        return self._values[j]
+
+    def __delitem__(self, k):
+        j = self.__find(k, hash(k))[0]
+
+        if j < 0:
+            raise KeyError("KeyError: " + repr(k))
+
+        table = self._table
+        values = self._values
+        hashes = self._hashes
+        distances = self._distances
+        capacity = len(table)
+        self._totalDistance -= distances[j]
+
+        # backward shift: pull the rest of the cluster one slot closer to home
+        nextSlot = j + 1 if j + 1 < capacity else 0
+        while hashes[nextSlot] is not None and distances[nextSlot] > 0:
+            table[j], values[j], hashes[j] = table[nextSlot], values[nextSlot], hashes[nextSlot]
+            distances[j] = distances[nextSlot] - 1
+            self._totalDistance -= 1
+            j = nextSlot
+            nextSlot = j + 1 if j + 1 < capacity else 0
+
+        table[j] = values[j] = hashes[j] = None
+        distances[j] = 0
+        self._size -= 1
+
+    def __contains__(self, k):
+        return self.__find(k, hash(k))[0] >= 0
+
+    def __iter__(self):
+        for key, h in zip(self._table, self._hashes):
+            if h is not None:
+                yield key
+
+    def maxProbeLength(self):
+        """
+        Returns the number of slots probed by the longest successful lookup. Runs in O(N) time.
+        :return: int
+        """
+        if self._size == 0:
+            return 0
+        return 1 + max(distance for distance, h in zip(self._distances, self._hashes) if h is not None)
+
+    def meanProbeLength(self):
+        """
+        Returns the average number of slots probed by a successful lookup. Runs in O(1) time.
+        :return: float
+        """
+        if self._size == 0:
+            return 0.0
+        return 1 + self._totalDistance / self._size
+
+    def _resize(self, newCapacity):
+        oldTable, oldValues, oldHashes = self._table, self._values, self._hashes
+
+        self._adjustPrime(newCapacity)
+        self._table = [None] * newCapacity
+        self._values = [None] * newCapacity
+        self._hashes = [None] * newCapacity
+        self._distances = [0] * newCapacity
+        self._totalDistance = 0
+
+        for cursor in range(len(oldTable)):
+            if oldHashes[cursor] is not None:
+                self.__place(oldTable[cursor], oldValues[cursor], oldHashes[cursor], False)
+
+    def clear(self):
+        super().clear()
+        self._values = [None] * self._initialTableSize
+        self._hashes = [None] * self._initialTableSize
+        self._distances = [0] * self._initialTableSize
+        self._totalDistance = 0
+
+
+if __name__ == '__main__':
+    d = RobinHoodHashTable(load_factor=0.9)
+
+    for i in range(10000):
+        d['key-%s' % i] = i
+
+    for i in range(0, 10000, 3):
+        del d['key-%s' % i]
+
+    print(len(d))
+    print("max probe length: %s" % d.maxProbeLength())
+    print("mean probe length: %s" % d.meanProbeLength())
@@ -0,0 +1,218 @@
+
+from random import getrandbits
+from AbstractBases.SortedMap import SortedMap as abstractSortedMap
+
+
+class SkipListMap(abstractSortedMap):
+    """
+    Class implements a SortedMap with a skip list: a sorted linked list of nodes where every
+    node is also linked, with probability 1/2 per level, into the express lists above it.
+    Searches start at the top level and drop a level each time the next key would overshoot,
+    so get, set and delete run in O(log n) expected time, and ordered queries cost one search.
+    Range queries search for their start then walk the bottom list lazily.
+
+    Every list starts at a head sentinel holding MAX_LEVEL forward links.
+    """
+
+    MAX_LEVEL = 32
+
+    class _Node:
+        __slots__ = '_key', '_value', '_next'
+
+        def __init__(self, k, value, level):
+            self._key = k
+            self._value = value
+            self._next = [None] * level  # forward links, _next[0] being the bottom list
+
+    def __init__(self):
+        self.__head = self._Node(None, None, self.MAX_LEVEL)
+        self.__level = 1  # number of levels in use
+        self.__size = 0
+
+    def __randomLevel(self):
+        """
+        Returns the level of a new node, i with probability 1/2^i.
+        """
+        bits = getrandbits(self.MAX_LEVEL - 1)
+        level = 1
+        while bits & 1:
+            bits >>= 1
+            level += 1
+        return level
+
+    def __lastBefore(self, k):
+        """
+        Returns the last node whose key is less than k, the head if there is none.
+        """
+        node = self.__head
+        for level in range(self.__level - 1, -1, -1):
+            nextNode = node._next[level]
+            while nextNode is not None and nextNode._key < k:
+                node = nextNode
+                nextNode = node._next[level]
+        return node
+
+    def __lastNotAfter(self, k):
+        """
+        Returns the last node whose key is less than or equal to k, the head if there is none.
+        """
+        node = self.__head
+        for level in range(self.__level - 1, -1, -1):
+            nextNode = node._next[level]
+            while nextNode is not None and not k < nextNode._key:
+                node = nextNode
+                nextNode = node._next[level]
+        return node
+
+    def __predecessors(self, k):
+        """
+        Returns for every level in use the last node whose key is less than k.
+        :return: list of nodes
+        """
+        update = [self.__head] * self.MAX_LEVEL
+        node = self.__head
+        for level in range(self.__level - 1, -1, -1):
+            nextNode = node._next[level]
+            while nextNode is not None and nextNode._key < k:
+                node = nextNode
+                nextNode = node._next[level]
+            update[level] = node
+        return update
+
+    def __item(self, node):
+        if node is None or node is self.__head:
+            return None
+        return node._key, node._value
+
+    def __getitem__(self, k):
+        node = self.__lastBefore(k)._next[0]
+        if node is None or node._key != k:
+            raise KeyError("KeyError: " + repr(k))
+        return node._value
+
+    def __setitem__(self, k, value):
+        update = self.__predecessors(k)
+        node = update[0]._next[0]
+
+        if node is not None and node._key == k:
+            node._value = value
+            return
+
+        level = self.__randomLevel()
+        if level > self.__level:
+            self.__level = level
+
+        node = self._Node(k, value, level)
+        for i in range(level):
+            node._next[i] = update[i]._next[i]
+            update[i]._next[i] = node
+        self.__size += 1
+
+    def __delitem__(self, k):
+        update = self.__predecessors(k)
+        node = update[0]._next[0]
+
+        if node is None or node._key != k:
+            raise KeyError("KeyError: " + repr(k))
+
+        for i in range(len(node._next)):
+            update[i]._next[i] = node._next[i]
+
+        head = self.__head
+        while self.__level > 1 and head._next[self.__level - 1] is None:
+            self.__level -= 1
+        self.__size -= 1
+
+    def __contains__(self, k):
+        node = self.__lastBefore(k)._next[0]
+        return node is not None and node._key == k
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        node = self.__head._next[0]
+        while node is not None:
+            yield node._key
+            node = node._next[0]
+
+    def first(self):
+        return self.__item(self.__head._next[0])
+
+    def last(self):
+        node = self.__head
+        for level in range(self.__level - 1, -1, -1):
+            while node._next[level] is not None:
+                node = node._next[level]
+        return self.__item(node)
+
+    def floor(self, k):
+        return self.__item(self.__lastNotAfter(k))
+
+    def ceiling(self, k):
+        return self.__item(self.__lastBefore(k)._next[0])
+
+    def predecessor(self, k):
+        return self.__item(self.__lastBefore(k))
+
+    def successor(self, k):
+        return self.__item(self.__lastNotAfter(k)._next[0])
+
+    def findRange(self, start=None, stop=None):
+        if start is None:
+            node = self.__head._next[0]
+        else:
+            node = self.__lastBefore(start)._next[0]
+
+        while node is not None and (stop is None or node._key < stop):
+            yield node._key, node._value
+            node = node._next[0]
+
+    def clear(self):
+        self.__head = self._Node(None, None, self.MAX_LEVEL)
+        self.__level = 1
+        self.__size = 0
+
+    @classmethod
+    def fromSorted(cls, pairs):
+        """
+        Build a map from (key, value) pairs sorted by strictly ascending keys, in O(n) time:
+        every node is appended at the tail of its lists instead of being searched for.
+        :param pairs: iterable of (key, value) pairs
+        :return: SkipListMap
+        :exception raise a ValueError if the keys are not strictly ascending
+        """
+        skipList = cls()
+        tails = [skipList.__head] * cls.MAX_LEVEL
+        previous = None
+        size = 0
+        topLevel = 1
+
+        for k, value in pairs:
+            if size and not previous < k:
+                raise ValueError("keys must be sorted in strictly ascending order.")
+
+            level = skipList.__randomLevel()
+            node = cls._Node(k, value, level)
+            for i in range(level):
+                tails[i]._next[i] = node
+                tails[i] = node
+
+            if level > topLevel:
+                topLevel = level
+            previous = k
+            size += 1
+
+        skipList.__level = topLevel
+        skipList.__size = size
+        return skipList
+
+
+if __name__ == '__main__':
+    m = SkipListMap.fromSorted((year, 'release %d' % year) for year in range(2010, 2020))
+    m[2021] = 'release 2021'
+    del m[2013]
+
+    print(len(m), m.first(), m.last())
+    print(m.floor(2013), m.ceiling(2013), m.predecessor(2010), m.successor(2019))
+    print(list(m.findRange(2012, 2016)))
@@ -0,0 +1,259 @@
+
+from math import ceil, floor
+from time import monotonic
+from AbstractBases.Map import Map as abstractMapBase
+from MapADT.ChainedHashTable import ChainedHashTable
+
+
+class TTLMap(abstractMapBase):
+    """
+    Class implements a map whose entries expire a given time to live (ttl) after being set.
+    Entries are stored in a ChainedHashTable, while expiry bookkeeping is done by a hierarchical
+    timer wheel: levels wheels of wheelSize slots each, level l slots being wheelSize^l ticks wide.
+    An entry is filed in the slot of the lowest level whose span reaches its expiry tick, and
+    moved down a level every time the clock crosses that slot, so it is handled at most
+    levels times before expiring: expiring entries costs amortized O(1) per entry rather than
+    a sweep over the whole table.
+
+    Expiry is applied:
+        lazily on read: an expired entry is never returned, it is removed when read.
+        on write: the wheel is advanced to the current time, expiring every due entry.
+        on expireNow(), e.g. when the caller is idle.
+    len() advances the wheel as well, so it only counts entries expired less than one tick ago,
+    while iteration skips every expired entry.
+    """
+
+    class _Entry:
+        __slots__ = '_key', '_value', '_expiry'
+
+        def __init__(self, k, value, expiry):
+            self._key = k
+            self._value = value
+            self._expiry = expiry
+
+    def __init__(self, ttl, tick=1.0, wheelSize=64, levels=4, clock=monotonic):
+        """
+        Init the map
+        :param ttl: default time to live of an entry, in the unit of clock
+        :param tick: granularity of the timer wheel, entries expire at most one tick late on
+                     write and expireNow() but never late on read
+        :param wheelSize: number of slots of every wheel, must be a power of 2
+        :param levels: number of wheels; entries beyond tick * wheelSize^levels are parked in
+                       an overflow list checked every time the top wheel turns over
+        :param clock: function returning the current time
+        """
+        if not (isinstance(ttl, int) or isinstance(ttl, float)) or ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+        if not (isinstance(tick, int) or isinstance(tick, float)) or tick <= 0:
+            raise ValueError("tick must be a positive number.")
+        if not isinstance(wheelSize, int) or wheelSize < 2 or wheelSize & (wheelSize - 1):
+            raise ValueError("wheelSize must be a power of 2.")
+        if not isinstance(levels, int) or levels < 1:
+            raise ValueError("levels must be a positive integer.")
+
+        self.__ttl = ttl
+        self.__tick = tick
+        self.__bits = wheelSize.bit_length() - 1
+        self.__mask = wheelSize - 1
+        self.__levels = levels
+        self.__clock = clock
+        self.__entries = ChainedHashTable()
+        self.__wheels = [[[] for slot in range(wheelSize)] for level in range(levels)]
+        self.__overflow = []
+        self.__currentTick = floor(clock() / tick)
+
+    def __expiryTick(self, entry):
+        return ceil(entry._expiry / self.__tick)
+
+    def __schedule(self, entry):
+        """
+        File an entry in the wheel slot its expiry tick falls in.
+        :return: False if the entry is already due
+        """
+        expiryTick = self.__expiryTick(entry)
+        currentTick = self.__currentTick
+
+        if expiryTick <= currentTick:
+            return False
+
+        for level in range(self.__levels):
+            shift = self.__bits * (level + 1)
+            if expiryTick >> shift == currentTick >> shift:
+                slot = (expiryTick >> (self.__bits * level)) & self.__mask
+                self.__wheels[level][slot].append(entry)
+                return True
+
+        self.__overflow.append(entry)
+        return True
+
+    def __expire(self, entry):
+        """
+        Remove an entry whose slot has been reached if it is due, or refile it a level down
+        otherwise. Entries replaced or deleted since they were filed are dropped.
+        :return: 1 if an entry was removed, 0 otherwise
+        """
+        try:
+            current = self.__entries[entry._key]
+        except KeyError:
+            return 0
+
+        if current is not entry:
+            return 0
+
+        if self.__schedule(entry):
+            return 0
+
+        del self.__entries[entry._key]
+        return 1
+
+    def __advance(self, now):
+        """
+        Turn the wheels up to time now, moving entries down a level as their slot is crossed
+        and expiring the ones that are due.
+        :return: number of entries expired
+        """
+        targetTick = floor(now / self.__tick)
+        expired = 0
+
+        if targetTick - self.__currentTick > (1 << (self.__bits * self.__levels)):
+            return self.__rebuild(targetTick)
+
+        while self.__currentTick < targetTick:
+            self.__currentTick += 1
+            currentTick = self.__currentTick
+
+            for level in range(1, self.__levels + 1):
+                if currentTick & ((1 << (self.__bits * level)) - 1):
+                    break
+
+                if level == self.__levels:
+                    entries, self.__overflow = self.__overflow, []
+                else:
+                    slots = self.__wheels[level]
+                    slot = (currentTick >> (self.__bits * level)) & self.__mask
+                    entries, slots[slot] = slots[slot], []
+
+                for entry in entries:
+                    expired += self.__expire(entry)
+
+            slots = self.__wheels[0]
+            slot = currentTick & self.__mask
+            entries, slots[slot] = slots[slot], []
+            for entry in entries:
+                expired += self.__expire(entry)
+
+        return expired
+
+    def __rebuild(self, targetTick):
+        """
+        Jump straight to targetTick after a long idle period by refiling every live entry,
+        in O(n) time, rather than turning the wheels one tick at a time.
+        :return: number of entries expired
+        """
+        self.__currentTick = targetTick
+        self.__wheels = [[[] for slot in range(self.__mask + 1)] for level in range(self.__levels)]
+        self.__overflow = []
+        due = []
+
+        for k in self.__entries:
+            entry = self.__entries[k]
+            if not self.__schedule(entry):
+                due.append(k)
+
+        for k in due:
+            del self.__entries[k]
+
+        return len(due)
+
+    def set(self, k, value, ttl=None):
+        """
+        Set the value of key k, expiring ttl from now.
+        :param ttl: time to live of this entry, defaults to the ttl of the map
+        """
+        if ttl is None:
+            ttl = self.__ttl
+        elif not (isinstance(ttl, int) or isinstance(ttl, float)) or ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+
+        now = self.__clock()
+        self.__advance(now)
+
+        entry = self._Entry(k, value, now + ttl)
+        self.__entries[k] = entry
+        self.__schedule(entry)
+
+    def __setitem__(self, k, value):
+        self.set(k, value)
+
+    def __getitem__(self, k):
+        entry = self.__entries[k]
+
+        if entry._expiry <= self.__clock():
+            del self.__entries[k]
+            raise KeyError("KeyError: " + repr(k))
+        return entry._value
+
+    def __delitem__(self, k):
+        self.__advance(self.__clock())
+        del self.__entries[k]
+
+    def __contains__(self, k):
+        try:
+            self[k]
+        except KeyError:
+            return False
+        return True
+
+    def ttl(self, k):
+        """
+        Returns the time left before key k expires.
+        :exception raise a KeyError if k is not in the map
+        """
+        entry = self.__entries[k]
+        remaining = entry._expiry - self.__clock()
+
+        if remaining <= 0:
+            del self.__entries[k]
+            raise KeyError("KeyError: " + repr(k))
+        return remaining
+
+    def expireNow(self):
+        """
+        Expire every entry due by now.
+        :return: number of entries expired
+        """
+        return self.__advance(self.__clock())
+
+    def __len__(self):
+        self.__advance(self.__clock())
+        return len(self.__entries)
+
+    def __iter__(self):
+        now = self.__clock()
+        self.__advance(now)
+        for k in list(self.__entries):
+            if self.__entries[k]._expiry > now:
+                yield k
+
+    def clear(self):
+        self.__entries = ChainedHashTable()
+        self.__wheels = [[[] for slot in range(self.__mask + 1)] for level in range(self.__levels)]
+        self.__overflow = []
+
+
+if __name__ == '__main__':
+    now = [0.0]
+    sessions = TTLMap(ttl=30, clock=lambda: now[0])
+
+    sessions['alice'] = 'token-1'
+    sessions['bob'] = 'token-2'
+    sessions.set('carol', 'token-3', ttl=3600)
+
+    now[0] = 29.5
+    print(sorted(sessions.items()))
+
+    now[0] = 31
+    print('alice' in sessions, sessions.expireNow(), len(sessions))
+
+    now[0] = 3601
+    print(len(sessions))
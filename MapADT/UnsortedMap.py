@@ -2,31 +2,91 @@
 from AbstractBases.Map import Map as abstractMapBase
 
 class UnsortedMap(abstractMapBase):
+    """
+    Class implements a map as an unsorted list of items.
+    Each item caches the hash value of its key, so a scan only checks equality
+    on the items whose hash value matches the key in question.
+    """
 
     def __init__(self):
         self.__table = []
 
+    def __hashOf(self, k):
+        try:
+            return hash(k)
+        except TypeError:  # unhashable keys are still allowed, they are compared by equality only
+            return None
+
     def __setitem__(self, k, value):
-        for item in self.__table:
-            if item._key == k:
-                item._value = value
-                return
-        self.__table.append(self._Item(k, value))
+        self._setWithHash(k, value, self.__hashOf(k))
 
     def __getitem__(self, k):
+        return self._getWithHash(k, self.__hashOf(k))
+
+    def __delitem__(self, k):
+        self._deleteWithHash(k, self.__hashOf(k))
+
+    def _setWithHash(self, k, value, h):
+        """
+        Add or replace the value of key k whose hash value h is already known.
+        :return: True if a new item was added, False if an existing one was replaced
+        """
+        for item in self.__table:
+            if item._hash == h and (item._key is k or item._key == k):
+                item._value = value
+                return False
+        self.__table.append(self._Item(k, value, h))
+        return True
+
+    def _getWithHash(self, k, h):
+        """
+        Return the value of key k whose hash value h is already known.
+        :exception raise a KeyError if k is not in the map
+        """
         for item in self.__table:
-            if item._key == k:
+            if item._hash == h and (item._key is k or item._key == k):
                 return item._value
 
         raise KeyError("KeyError: " + repr(k))
 
-    def __delitem__(self, k):
-        for cursor in range(len(self.__table)):
-            if self.__table[cursor]._key == k:
-                self.__table.pop(cursor)
+    def _deleteWithHash(self, k, h):
+        """
+        Remove key k whose hash value h is already known.
+        :exception raise a KeyError if k is not in the map
+        """
+        table = self.__table
+        for cursor in range(len(table)):
+            item = table[cursor]
+            if item._hash == h and (item._key is k or item._key == k):
+                table.pop(cursor)
                 return
         raise KeyError("KeyError: " + repr(k))
 
+    def _locate(self, k, h):
+        """
+        Scan for key k whose hash value h is already known.
+        :return: tuple (item, probes), item being None if k is not in the map and probes the
+                 number of items examined
+        """
+        for cursor, item in enumerate(self.__table):
+            if item._hash == h and (item._key is k or item._key == k):
+                return item, cursor + 1
+        return None, len(self.__table)
+
+    def _items(self):
+        """
+        Returns a generator over the _Item objects of the map.
+        """
+        for item in self.__table:
+            yield item
+
+    def _appendItem(self, item):
+        """
+        Append an _Item whose key is known not to be in the map, without scanning.
+        :param item: _Item object
+        """
+        self.__table.append(item)
+
     def __len__(self):
         return len(self.__table)
 
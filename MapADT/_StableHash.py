@@ -0,0 +1,120 @@
+
+from hashlib import blake2b
+from numbers import Integral, Number
+from pickle import dumps
+
+
+class StableHash():
+    """
+    Class provides hash values that, unlike the builtin hash(), are the same in every process
+    and across restarts (hash() of str and bytes is salted per process), for structures shared
+    between processes or persisted to disk.
+
+    Keys equal by == get the same stable hash value whenever they are numbers or tuples of them:
+    an integral number is taken as an int and any other number as a float when it is exactly
+    one, so 1, 1.0, True, Fraction(1, 2) == 0.5 or (1, 'a') == (1.0, 'a') agree. keyBytes()
+    serializes such keys in that normal form, tuples of any tuple subclass becoming plain
+    tuples, so keys compared by their serialized form compare like they do with ==; of() hashes
+    an equivalent canonical form.
+
+    The pickled form of a frozenset follows its iteration order, which depends on the salted
+    hash() of its elements and so changes from process to process. of() hashes frozensets from
+    the sorted canonical forms of their elements instead, while keyBytes() rejects keys holding
+    a frozenset or a set, met directly or within tuples, since their serialized form could not
+    be matched by another process. Sets hidden inside other objects cannot be detected and must
+    be avoided in keys given to keyBytes().
+    """
+
+    PICKLE_PROTOCOL = 4
+
+    @staticmethod
+    def keyBytes(k):
+        """
+        Returns the serialized form of a key, numbers and tuples being put in normal form first.
+        :return: bytes
+        :exception raise a TypeError if k is, or has within tuples, a frozenset or a set
+        """
+        keyType = type(k)
+        if keyType is not str and keyType is not int and keyType is not bytes:
+            k = StableHash.normalizeKey(k)
+        return dumps(k, protocol=StableHash.PICKLE_PROTOCOL)
+
+    @staticmethod
+    def normalizeKey(k):
+        """
+        Returns the normal form of a key serialized by keyBytes(): numbers as described above,
+        tuples as plain tuples of normalized elements, any other key as it is.
+        :exception raise a TypeError if k is, or has within tuples, a frozenset or a set
+        """
+        if isinstance(k, (frozenset, set)):
+            raise TypeError("Keys holding a frozenset or a set have no stable serialized form.")
+        if isinstance(k, tuple):
+            return tuple(StableHash.normalizeKey(e) for e in k)
+        if isinstance(k, Number):
+            return StableHash.__normalizeNumber(k)
+        return k
+
+    @staticmethod
+    def valueBytes(value):
+        """
+        Returns the serialized form of a value, which unlike a key is never compared.
+        :return: bytes
+        """
+        return dumps(value, protocol=StableHash.PICKLE_PROTOCOL)
+
+    @staticmethod
+    def ofBytes(data):
+        """
+        Returns the stable hash value of serialized data, a non-negative 63 bits integer.
+        :return: int
+        """
+        return int.from_bytes(blake2b(data, digest_size=8).digest(), 'little') >> 1
+
+    @staticmethod
+    def __normalizeNumber(n):
+        """
+        Returns the int, or else the float, equal to number n, or n itself if there is none.
+        """
+        if isinstance(n, Integral):
+            return int(n)
+        if isinstance(n, complex):
+            if n.imag != 0:
+                return n
+            n = n.real
+        try:
+            if n == int(n):
+                return int(n)
+            if float(n) == n:
+                return float(n)
+        except (ValueError, OverflowError, TypeError):  # nan, infinities, exotic numbers
+            pass
+        return n
+
+    @staticmethod
+    def __canonicalBytes(k):
+        """
+        Returns the serialized canonical form of a key hashed by of().
+        :return: bytes
+        """
+        keyType = type(k)
+        if keyType is str or keyType is int or keyType is bytes:
+            return dumps(k, protocol=StableHash.PICKLE_PROTOCOL)
+
+        if isinstance(k, tuple):
+            return dumps(('tuple', tuple(StableHash.__canonicalBytes(e) for e in k)),
+                         protocol=StableHash.PICKLE_PROTOCOL)
+        if isinstance(k, frozenset):
+            return dumps(('frozenset', tuple(sorted(StableHash.__canonicalBytes(e) for e in k))),
+                         protocol=StableHash.PICKLE_PROTOCOL)
+        if isinstance(k, Number):
+            k = StableHash.__normalizeNumber(k)
+        return dumps(k, protocol=StableHash.PICKLE_PROTOCOL)
+
+    @staticmethod
+    def of(k):
+        """
+        Returns the stable hash value of a key, a non-negative 63 bits integer, the same for
+        keys equal by == as described above.
+        :return: int
+        """
+        return StableHash.ofBytes(StableHash.__canonicalBytes(k))
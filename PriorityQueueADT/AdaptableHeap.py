@@ -0,0 +1,181 @@
+
+from AbstractBases.PriorityQueue import PriorityQueue as abstractPQ
+from AppException.PriorityQueueException import PriorityQueueException
+
+
+class AdaptableHeap(abstractPQ):
+    """
+    Class implements an adaptable binary heap: insert() returns a locator for the element added,
+    through which the element can later be updated, e.g. to decrease its key, or removed from
+    anywhere in the heap, both in O(log n) time.
+
+    The heap array holds the locators themselves, and every locator records its current index in
+    the array, kept up to date by every move made while percolating, so finding the element of a
+    locator takes no search.
+    """
+
+    class Locator:
+        """
+        Class represent the handle of an element of the heap.
+        """
+        __slots__ = '_element', '_index'
+
+        def __init__(self, e, i):
+            self._element = e
+            self._index = i
+
+        def element(self):
+            """
+            Returns the element this locator stands for.
+            """
+            return self._element
+
+    def __init__(self, order=0, dType=int):
+
+        if not isinstance(order, int):
+            raise TypeError("order must be an integer")
+
+        self.__isMin = order == 0
+        self.__data = []
+        self.__dType = dType
+
+    def __validateDType(self, e):
+        if not isinstance(e, self.__dType):
+            raise TypeError("e must be of %s" % self.__dType)
+
+    def __validateLocator(self, locator):
+        if not isinstance(locator, self.Locator):
+            raise TypeError("locator must be an AdaptableHeap.Locator.")
+
+        i = locator._index
+        if not (0 <= i < len(self.__data) and self.__data[i] is locator):
+            raise PriorityQueueException("Invalid locator.")
+
+    def __precedes(self, e, f):
+        """
+        Checks if element e must be closer to the top than element f.
+        """
+        if self.__isMin:
+            return e < f
+        return e > f
+
+    def __percolateUp(self, i):
+        data = self.__data
+        locator = data[i]
+
+        while i > 0:
+            parent = (i - 1) // 2
+            if not self.__precedes(locator._element, data[parent]._element):
+                break
+            data[i] = data[parent]
+            data[i]._index = i
+            i = parent
+
+        data[i] = locator
+        locator._index = i
+
+    def __percolateDown(self, i):
+        data = self.__data
+        size = len(data)
+        locator = data[i]
+
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and self.__precedes(data[child + 1]._element, data[child]._element):
+                child += 1
+            if not self.__precedes(data[child]._element, locator._element):
+                break
+            data[i] = data[child]
+            data[i]._index = i
+            i = child
+
+        data[i] = locator
+        locator._index = i
+
+    def __bubble(self, i):
+        """
+        Restore the heap order around index i, whose element may have moved either way.
+        """
+        if i > 0 and self.__precedes(self.__data[i]._element, self.__data[(i - 1) // 2]._element):
+            self.__percolateUp(i)
+        else:
+            self.__percolateDown(i)
+
+    def insert(self, e):
+        """
+        Add an element to the heap.
+        :return: Locator of the element
+        """
+        self.__validateDType(e)
+        locator = self.Locator(e, len(self.__data))
+        self.__data.append(locator)
+        self.__percolateUp(locator._index)
+        return locator
+
+    def removeTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+        return self.remove(self.__data[0])
+
+    def update(self, locator, e):
+        """
+        Replace the element of a locator by e, moving it up or down as its priority requires.
+        :exception raise a PriorityQueueException if the locator is not in the heap
+        """
+        self.__validateLocator(locator)
+        self.__validateDType(e)
+        locator._element = e
+        self.__bubble(locator._index)
+
+    def remove(self, locator):
+        """
+        Remove the element of a locator from the heap.
+        :return: the element removed
+        :exception raise a PriorityQueueException if the locator is not in the heap
+        """
+        self.__validateLocator(locator)
+        data = self.__data
+        i = locator._index
+        last = data.pop()
+
+        if last is not locator:
+            data[i] = last
+            last._index = i
+            self.__bubble(i)
+
+        locator._index = -1
+        return locator._element
+
+    def peekTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+        return self.__data[0]._element
+
+    def clear(self):
+        for locator in self.__data:
+            locator._index = -1
+        self.__data = []
+
+    def isEmpty(self):
+        return len(self.__data) == 0
+
+    def __len__(self):
+        return len(self.__data)
+
+    def size(self):
+        return len(self.__data)
+
+
+if __name__ == '__main__':
+
+    heap = AdaptableHeap(order=0, dType=tuple)
+
+    tasks = {name: heap.insert((priority, name))
+             for name, priority in [('backup', 5), ('deploy', 3), ('email', 8), ('report', 6)]}
+
+    heap.update(tasks['email'], (1, 'email'))
+    heap.remove(tasks['deploy'])
+
+    print([heap.removeTop() for i in range(len(heap))])
@@ -0,0 +1,124 @@
+
+from AbstractBases.PriorityQueue import PriorityQueue as abstractPQ
+from AppException.PriorityQueueException import PriorityQueueException
+
+
+class LeftistHeap(abstractPQ):
+    """
+    Class implements a leftist heap: a heap ordered binary tree where the rank of a node, the
+    length of its rightmost path, is never larger on the left child than on the right one.
+    The rightmost path of a tree of n nodes is thus at most log2(n + 1) long.
+
+    Two heaps are merged by walking down both rightmost paths at once, in priority order, then
+    swapping children on the way back up wherever the leftist property is broken. Merging, and
+    so meld, insert and removeTop, all run in O(log n) time in the worst case, not only
+    amortized.
+    """
+
+    class _Node:
+        __slots__ = '_element', '_left', '_right', '_rank'
+
+        def __init__(self, e):
+            self._element = e
+            self._left = None
+            self._right = None
+            self._rank = 1
+
+    def __init__(self, order=0, dType=int):
+
+        if not isinstance(order, int):
+            raise TypeError("order must be an integer")
+
+        self.__isMin = order == 0
+        self.__dType = dType
+        self.__root = None
+        self.__size = 0
+
+    def __validateDType(self, e):
+        if not isinstance(e, self.__dType):
+            raise TypeError("e must be of %s" % self.__dType)
+
+    def __merge(self, a, b):
+        """
+        Merge two leftist trees.
+        :return: root of the merged tree
+        """
+        isMin = self.__isMin
+        spine = []
+
+        while a is not None and b is not None:
+            if (b._element < a._element) if isMin else (b._element > a._element):
+                a, b = b, a
+            spine.append(a)
+            a = a._right
+
+        rest = a if a is not None else b
+        for node in reversed(spine):
+            node._right = rest
+            left = node._left
+            if left is None or left._rank < rest._rank:
+                node._left, node._right = rest, left
+            node._rank = node._right._rank + 1 if node._right is not None else 1
+            rest = node
+
+        return rest
+
+    def insert(self, e):
+        self.__validateDType(e)
+        self.__root = self.__merge(self.__root, self._Node(e))
+        self.__size += 1
+
+    def meld(self, other):
+        """
+        Move every element of another leftist heap of the same order into this one, in
+        O(log n) time. other is left empty.
+        """
+        if not isinstance(other, LeftistHeap) or other.__isMin != self.__isMin:
+            raise TypeError("other must be a LeftistHeap of the same order.")
+        if other is self:
+            return
+
+        self.__root = self.__merge(self.__root, other.__root)
+        self.__size += other.__size
+        other.__root = None
+        other.__size = 0
+
+    def removeTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+
+        root = self.__root
+        self.__root = self.__merge(root._left, root._right)
+        self.__size -= 1
+        return root._element
+
+    def peekTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+        return self.__root._element
+
+    def clear(self):
+        self.__root = None
+        self.__size = 0
+
+    def isEmpty(self):
+        return self.__size == 0
+
+    def __len__(self):
+        return self.__size
+
+    def size(self):
+        return self.__size
+
+
+if __name__ == '__main__':
+
+    queues = [LeftistHeap(order=1) for i in range(3)]
+    for n in [12, 4, 33, 7, 21, 5, 18, 40, 1]:
+        queues[n % 3].insert(n)
+
+    merged = queues[0]
+    merged.meld(queues[1])
+    merged.meld(queues[2])
+
+    print([merged.removeTop() for i in range(len(merged))], len(queues[1]))
@@ -0,0 +1,251 @@
+
+from AbstractBases.PriorityQueue import PriorityQueue as abstractPQ
+from AppException.PriorityQueueException import PriorityQueueException
+
+
+class PairingHeap(abstractPQ):
+    """
+    Class implements a pairing heap: a heap ordered tree of any shape, every node linking to its
+    leftmost child and to its next sibling. Linking two trees makes the root of lower priority
+    the leftmost child of the other, in O(1) time, so insert and meld run in O(1) time.
+    removeTop merges the children of the root back into one tree with the two-pass pairing
+    scheme (link them by pairs from left to right, then fold the pairs from right to left) in
+    O(log n) amortized time.
+
+    insert() returns a locator: update() raises the priority of its element in O(1) time (cut
+    its subtree and link it with the root) and lowers it or remove() removes it in
+    O(log n) amortized time.
+
+    Locators keep working after their heap is melded into another: every heap has an owner
+    record, and meld() forwards the owner of the melded heap to the owner of the other one.
+    """
+
+    class Locator:
+        """
+        Class represent the handle of an element of the heap, which is also its tree node.
+        """
+        __slots__ = '_element', '_child', '_sibling', '_prev', '_owner'
+
+        def __init__(self, e, owner):
+            self._element = e
+            self._child = None  # leftmost child
+            self._sibling = None  # next sibling on the right
+            self._prev = None  # parent if leftmost child, left sibling otherwise
+            self._owner = owner
+
+        def element(self):
+            """
+            Returns the element this locator stands for.
+            """
+            return self._element
+
+    class _Owner:
+        __slots__ = '_forward'
+
+        def __init__(self):
+            self._forward = None  # owner of the heap this one was melded into
+
+    def __init__(self, order=0, dType=int):
+
+        if not isinstance(order, int):
+            raise TypeError("order must be an integer")
+
+        self.__isMin = order == 0
+        self.__dType = dType
+        self.__root = None
+        self.__size = 0
+        self.__owner = self._Owner()
+
+    def __validateDType(self, e):
+        if not isinstance(e, self.__dType):
+            raise TypeError("e must be of %s" % self.__dType)
+
+    def __validateLocator(self, locator):
+        if not isinstance(locator, self.Locator):
+            raise TypeError("locator must be a PairingHeap.Locator.")
+
+        owner = locator._owner
+        if owner is None:
+            raise PriorityQueueException("Invalid locator.")
+        while owner._forward is not None:
+            owner = owner._forward
+        locator._owner = owner
+
+        if owner is not self.__owner:
+            raise PriorityQueueException("Invalid locator.")
+
+    def __precedes(self, e, f):
+        """
+        Checks if element e must be closer to the top than element f.
+        """
+        if self.__isMin:
+            return e < f
+        return e > f
+
+    def __link(self, a, b):
+        """
+        Link two detached trees, the root of lower priority becoming the leftmost child of the
+        other, and return the root of the result.
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        if self.__precedes(b._element, a._element):
+            a, b = b, a
+
+        b._sibling = a._child
+        if a._child is not None:
+            a._child._prev = b
+        b._prev = a
+        a._child = b
+        return a
+
+    def __cut(self, node):
+        """
+        Detach the subtree rooted at node from its parent and siblings.
+        """
+        prev = node._prev
+        if prev._child is node:
+            prev._child = node._sibling
+        else:
+            prev._sibling = node._sibling
+        if node._sibling is not None:
+            node._sibling._prev = prev
+        node._prev = node._sibling = None
+
+    def __mergeChildren(self, node):
+        """
+        Detach the children of node and merge them into one tree by two-pass pairing.
+        :return: root of the merged tree, or None if node has no child
+        """
+        pairs = []
+        child = node._child
+        node._child = None
+
+        while child is not None:
+            first = child
+            second = child._sibling
+            child = second._sibling if second is not None else None
+
+            first._prev = first._sibling = None
+            if second is not None:
+                second._prev = second._sibling = None
+            pairs.append(self.__link(first, second))
+
+        root = None
+        for tree in reversed(pairs):
+            root = self.__link(tree, root)
+        return root
+
+    def insert(self, e):
+        """
+        Add an element to the heap.
+        :return: Locator of the element
+        """
+        self.__validateDType(e)
+        locator = self.Locator(e, self.__owner)
+        self.__root = self.__link(self.__root, locator)
+        self.__size += 1
+        return locator
+
+    def meld(self, other):
+        """
+        Move every element of another pairing heap of the same order into this one, in O(1)
+        time. other is left empty; its locators now belong to this heap.
+        """
+        if not isinstance(other, PairingHeap) or other.__isMin != self.__isMin:
+            raise TypeError("other must be a PairingHeap of the same order.")
+        if other is self:
+            return
+
+        self.__root = self.__link(self.__root, other.__root)
+        self.__size += other.__size
+        other.__owner._forward = self.__owner
+
+        other.__root = None
+        other.__size = 0
+        other.__owner = self._Owner()
+
+    def removeTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+        return self.remove(self.__root)
+
+    def update(self, locator, e):
+        """
+        Replace the element of a locator by e, moving it up or down as its priority requires.
+        :exception raise a PriorityQueueException if the locator is not in the heap
+        """
+        self.__validateLocator(locator)
+        self.__validateDType(e)
+
+        if self.__precedes(locator._element, e):
+            # lower priority: take the node out and put it back with its new element
+            self.remove(locator)
+            locator._element = e
+            locator._owner = self.__owner
+            self.__root = self.__link(self.__root, locator)
+            self.__size += 1
+            return
+
+        locator._element = e
+        if locator is not self.__root:
+            self.__cut(locator)
+            self.__root = self.__link(self.__root, locator)
+
+    def remove(self, locator):
+        """
+        Remove the element of a locator from the heap.
+        :return: the element removed
+        :exception raise a PriorityQueueException if the locator is not in the heap
+        """
+        self.__validateLocator(locator)
+
+        if locator is self.__root:
+            self.__root = self.__mergeChildren(locator)
+        else:
+            self.__cut(locator)
+            self.__root = self.__link(self.__root, self.__mergeChildren(locator))
+
+        locator._owner = None
+        self.__size -= 1
+        return locator._element
+
+    def peekTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+        return self.__root._element
+
+    def clear(self):
+        self.__root = None
+        self.__size = 0
+        self.__owner = self._Owner()
+
+    def isEmpty(self):
+        return self.__size == 0
+
+    def __len__(self):
+        return self.__size
+
+    def size(self):
+        return self.__size
+
+
+if __name__ == '__main__':
+
+    workers = [PairingHeap(order=0, dType=tuple) for i in range(3)]
+    jobs = {}
+    for cursor, (name, priority) in enumerate([('index', 7), ('compile', 3), ('lint', 9),
+                                               ('test', 4), ('deploy', 8), ('docs', 6)]):
+        jobs[name] = workers[cursor % 3].insert((priority, name))
+
+    merged = workers[0]
+    merged.meld(workers[1])
+    merged.meld(workers[2])
+
+    merged.update(jobs['deploy'], (1, 'deploy'))
+    merged.remove(jobs['lint'])
+
+    print([merged.removeTop() for i in range(len(merged))])
@@ -0,0 +1,149 @@
+
+from AbstractBases.PriorityQueue import PriorityQueue as abstractPQ
+from AppException.PriorityQueueException import PriorityQueueException
+
+
+class RadixHeap(abstractPQ):
+    """
+    Class implements a radix heap: a min priority queue for non-negative integer priorities
+    that is monotone, i.e. never given a priority smaller than the last one removed, as with
+    timestamps or the distances of Dijkstra's algorithm.
+
+    Items are kept in buckets by the highest bit where their priority differs from last, the
+    priority of the last item removed: bucket 0 holds priority last itself, and bucket i the
+    priorities sharing the bits of last above bit i - 1 but not that bit. Once bucket 0 is empty,
+    removeTop takes the first non empty bucket, makes its smallest priority the new last and
+    spreads its items over lower buckets. An item only ever moves to lower buckets, so for
+    priorities of b bits every operation runs in O(b) amortized time, with no comparison of
+    items besides the bucket scan.
+
+    Only removeTop moves last, so it is always the priority of the last item removed: peekTop
+    finds the top item without redistributing and remembers it until an insert goes before it.
+    Inserting a priority smaller than last would break the bucket layout: it raises a
+    PriorityQueueException, a check skipped when Python runs with -O.
+    """
+
+    def __init__(self):
+        self.__buckets = [[] for i in range(65)]  # lists of (priority, element)
+        self.__last = 0
+        self.__size = 0
+        self.__top = None  # (priority, element) found by peekTop outside of bucket 0
+
+    def insert(self, e, priority=None):
+        """
+        Add an element to the heap.
+        :param e: element to add, which is its own priority if priority is None
+        :param priority: non-negative integer priority of e
+        """
+        if priority is None:
+            priority = e
+        if not isinstance(priority, int):
+            raise TypeError("priority must be an integer")
+
+        if __debug__:
+            if priority < self.__last:
+                raise PriorityQueueException("Priority %d is smaller than the last one removed, %d."
+                                             % (priority, self.__last))
+
+        top = self.__top
+        if top is not None and priority <= top[0]:
+            self.__top = None
+
+        bucket = (priority ^ self.__last).bit_length()
+        while bucket >= len(self.__buckets):
+            self.__buckets.append([])
+        self.__buckets[bucket].append((priority, e))
+        self.__size += 1
+
+    def __refill(self):
+        """
+        Make sure bucket 0 is not empty, redistributing the first non empty bucket if needed.
+        """
+        buckets = self.__buckets
+        if buckets[0]:
+            return
+
+        i = 1
+        while not buckets[i]:
+            i += 1
+
+        items = buckets[i]
+        buckets[i] = []
+        last = min(items, key=lambda item: item[0])[0]
+        self.__last = last
+
+        for item in items:
+            buckets[(item[0] ^ last).bit_length()].append(item)
+
+    def removeTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+
+        self.__refill()
+        self.__top = None
+        self.__size -= 1
+        return self.__buckets[0].pop()[1]
+
+    def peekTop(self):
+        if self.isEmpty():
+            raise PriorityQueueException("The heap is empty.")
+
+        buckets = self.__buckets
+        if buckets[0]:
+            return buckets[0][-1][1]
+
+        if self.__top is None:
+            i = 1
+            while not buckets[i]:
+                i += 1
+
+            # the last of the smallest items, the one removeTop pops once they are in bucket 0
+            top = None
+            for item in buckets[i]:
+                if top is None or item[0] <= top[0]:
+                    top = item
+            self.__top = top
+
+        return self.__top[1]
+
+    def lastPriority(self):
+        """
+        Returns the priority of the last item removed, 0 before any, which is the smallest
+        priority insert accepts.
+        :return: int
+        """
+        return self.__last
+
+    def clear(self):
+        self.__buckets = [[] for i in range(65)]
+        self.__last = 0
+        self.__size = 0
+        self.__top = None
+
+    def isEmpty(self):
+        return self.__size == 0
+
+    def __len__(self):
+        return self.__size
+
+    def size(self):
+        return self.__size
+
+
+if __name__ == '__main__':
+
+    graph = {'a': [('b', 4), ('c', 1)], 'b': [('d', 1)], 'c': [('b', 2), ('d', 5)], 'd': []}
+    distances = {}
+    heap = RadixHeap()
+    heap.insert('a', 0)
+
+    while not heap.isEmpty():
+        node = heap.removeTop()
+        distance = heap.lastPriority()
+        if node in distances:
+            continue
+        distances[node] = distance
+        for neighbour, weight in graph[node]:
+            heap.insert(neighbour, distance + weight)
+
+    print(distances)